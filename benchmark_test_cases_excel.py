@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Partner Dashboard Test Cases workbook generator
+Builds synthetic catalogs at increasing sizes and measures every writer phase
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import openpyxl
+
+from testcases.build import create_excel_file, create_sharded_excel_file
+from testcases.catalog import SummaryCube, catalog_modules, load_test_cases
+from testcases.writer import create_summary_sheet, register_styles
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Phases are skipped above these sizes unless asked for by name: the
+# standard writer keeps every cell in memory and needs minutes (and GBs) at 1M
+PHASE_MAX_ROWS = {"standard": 100_000}
+
+# Fragments for long Japanese test steps, in the style of the real catalog
+SCREENS = ["ダッシュボード", "受注一覧", "受注詳細", "顧客一覧", "顧客詳細", "アカウント設定", "システム管理", "ログイン画面"]
+FIELDS = ["受注番号", "顧客名", "メールアドレス", "電話番号", "配送先住所", "支払方法", "ステータス", "受注日", "合計金額", "備考"]
+ACTIONS = [
+    "{screen}を開き、{field}欄が表示されていることを確認する",
+    "{field}に最大文字数の値を入力し、保存ボタンをクリックする",
+    "{field}を空欄のまま「登録」をクリックし、エラーメッセージを確認する",
+    "検索条件に{field}を指定して検索し、結果一覧を確認する",
+    "{screen}で{field}の昇順・降順ソートを切り替える",
+    "Verify {field} on {screen} matches the value returned by the API",
+    "ページングで次ページへ移動し、{field}が正しく表示されることを確認する",
+    "CSVエクスポートを実行し、{field}列が出力されていることを確認する",
+]
+RESULTS = [
+    "{field}が正しく表示され、エラーが発生しないこと",
+    "入力値が保存され、{screen}に反映されること",
+    "「{field}は必須項目です」と表示されること",
+    "Response matches the {field} shown on {screen}",
+]
+
+def synthetic_test_cases(count, seed=0, catalog=None):
+    """Yield count test cases shaped like the catalog's, deterministic for a seed
+
+    Each case copies Module, Test Type, Priority, Status and the ID prefix
+    from a randomly drawn catalog case, so their distributions follow the
+    real catalog, and gets 3-8 lines of generated Japanese step text.
+    """
+    rng = random.Random(seed)
+    templates = catalog if catalog is not None else load_test_cases()
+    for number in range(1, count + 1):
+        template = rng.choice(templates)
+        context = {"screen": rng.choice(SCREENS), "field": rng.choice(FIELDS)}
+        steps = [
+            f"{index}. " + rng.choice(ACTIONS).format(screen=rng.choice(SCREENS), field=rng.choice(FIELDS))
+            for index in range(1, rng.randint(3, 8) + 1)
+        ]
+        prefix = template["Test Case ID"].rsplit("-", 1)[0]
+        yield {
+            "Test Case ID": f"{prefix}-{number:07d}",
+            "Module": template["Module"],
+            "Test Case Name": f"{template['Test Case Name']} ({context['field']})",
+            "Test Type": template["Test Type"],
+            "Priority": template["Priority"],
+            "Preconditions": f"{template['Preconditions']}\n{context['screen']}にログイン済み",
+            "Test Steps": "\n".join(steps),
+            "Expected Results": rng.choice(RESULTS).format(**context),
+            "Status": template["Status"],
+            "Notes": template["Notes"] if rng.random() < 0.3 else "",
+        }
+
+def write_synthetic_catalog(count, catalog_dir, seed=0):
+    """Write count synthetic test cases as a catalog directory (index.json plus JSONL per module)"""
+    files = {}
+    try:
+        for test_case in synthetic_test_cases(count, seed):
+            module = test_case["Module"]
+            if module not in files:
+                name = f"module_{len(files):02d}.jsonl"
+                files[module] = (name, open(os.path.join(catalog_dir, name), "w", encoding="utf-8"))
+            files[module][1].write(json.dumps(test_case, ensure_ascii=False) + "\n")
+    finally:
+        for _, f in files.values():
+            f.close()
+    with open(os.path.join(catalog_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"modules": [{"module": module, "file": name} for module, (name, _) in files.items()]}, f, indent=4)
+    return catalog_dir
+
+# ==================== PHASES ====================
+# Each phase is (setup, run): setup(rows, tmp) prepares the input outside the
+# measurement, run(data, path) is what gets measured. Writers consume the
+# synthetic cases lazily, so "generate" is the baseline to subtract. The
+# save-* phases are the streaming writer with another zip compression level
+# (streaming itself is the default, deflate level 6) or an in-memory zip. The load
+# phases hold a whole catalog in memory, as TestCase records or as plain
+# dicts, to compare their footprint.
+
+def _setup_stream(rows, tmp):
+    return synthetic_test_cases(rows)
+
+def _setup_cube(rows, tmp):
+    return SummaryCube(synthetic_test_cases(rows))
+
+def _setup_catalog(rows, tmp):
+    return write_synthetic_catalog(rows, tempfile.mkdtemp(dir=tmp))
+
+def _run_generate(cases, path):
+    for _ in cases:
+        pass
+
+def _run_standard(cases, path):
+    create_excel_file(path, cases=cases)
+
+def _run_streaming(cases, path):
+    create_excel_file(path, cases=cases, mode="streaming")
+
+def _saving(**options):
+    def run(cases, path):
+        create_excel_file(path, cases=cases, mode="streaming", **options)
+    return run
+
+def _run_sharded(cases, path):
+    create_sharded_excel_file(path, cases=cases)
+
+def _run_summary(cube, path):
+    wb = openpyxl.Workbook(write_only=True)
+    register_styles(wb)
+    create_summary_sheet(wb, cube)
+    wb.save(path)
+
+def _run_load(catalog_dir, path):
+    return load_test_cases(catalog_dir=catalog_dir)
+
+def _run_load_dicts(catalog_dir, path):
+    cases = []
+    for _, module_path in catalog_modules(catalog_dir):
+        with open(module_path, encoding="utf-8") as f:
+            cases.extend(json.loads(line) for line in f)
+    return cases
+
+PHASES = {
+    "generate": (_setup_stream, _run_generate),
+    "standard": (_setup_stream, _run_standard),
+    "streaming": (_setup_stream, _run_streaming),
+    "save-stored": (_setup_stream, _saving(compression=0)),
+    "save-fast": (_setup_stream, _saving(compression=1)),
+    "save-best": (_setup_stream, _saving(compression=9)),
+    "save-memory": (_setup_stream, _saving(in_memory=True)),
+    "sharded": (_setup_stream, _run_sharded),
+    "summary": (_setup_cube, _run_summary),
+    "load": (_setup_catalog, _run_load),
+    "load-dicts": (_setup_catalog, _run_load_dicts),
+}
+
+def _peak_rss():
+    """Return the peak resident set size of this process in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def _measure(phase, rows, trace, conn):
+    # Runs in a fresh process so the RSS peak belongs to this phase alone
+    setup, run = PHASES[phase]
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        path = os.path.join(tmp, f"{phase}.xlsx")
+        data = setup(rows, tmp)
+        if trace:
+            tracemalloc.start()
+        start, cpu_start = time.perf_counter(), time.process_time()
+        run(data, path)
+        wall, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+        traced_peak = tracemalloc.get_traced_memory()[1] if trace else None
+        tracemalloc.stop()
+        conn.send({
+            "wall_s": round(wall, 3),
+            "cpu_s": round(cpu, 3),
+            "peak_rss_bytes": _peak_rss(),
+            "file_size_bytes": os.path.getsize(path) if os.path.exists(path) else None,
+            "tracemalloc_peak_bytes": traced_peak,
+        })
+
+def _in_child(phase, rows, trace):
+    context = multiprocessing.get_context("spawn")
+    parent, child = context.Pipe(duplex=False)
+    process = context.Process(target=_measure, args=(phase, rows, trace, child))
+    process.start()
+    child.close()
+    try:
+        result = parent.recv()
+    except EOFError:
+        result = None
+    process.join()
+    if result is None:
+        raise RuntimeError(f"{phase} at {rows} rows failed (exit code {process.exitcode})")
+    return result
+
+def run_benchmark(phase, rows, tracemalloc_peak=True):
+    """Return the measurements of one phase at one catalog size
+
+    Wall/CPU time, peak RSS and file size come from an untraced run.
+    tracemalloc slows allocation-heavy code several times over, so its peak
+    is taken from a second, traced run.
+    """
+    result = {"phase": phase, "rows": rows, **_in_child(phase, rows, False)}
+    if tracemalloc_peak:
+        result["tracemalloc_peak_bytes"] = _in_child(phase, rows, True)["tracemalloc_peak_bytes"]
+    return result
+
+def environment():
+    """Return what the numbers depend on besides the code"""
+    return {
+        "python": platform.python_version(),
+        "openpyxl": openpyxl.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+def compare(results, baseline, tolerance):
+    """Return the regressions of results against a baseline report
+
+    A regression is a wall time or peak RSS more than tolerance (a fraction)
+    above the baseline's for the same phase and size.
+    """
+    previous = {(entry["phase"], entry["rows"]): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["phase"], entry["rows"]))
+        if not before:
+            continue
+        for metric in ("wall_s", "peak_rss_bytes"):
+            if before[metric] and entry[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{entry['phase']} at {entry['rows']:,} rows: {metric} "
+                    f"{before[metric]:,} -> {entry[metric]:,} (+{entry[metric] / before[metric] - 1:.0%})"
+                )
+    return regressions
+
+def _format_row(entry):
+    mb = 1024 * 1024
+    traced = entry.get("tracemalloc_peak_bytes")
+    size = entry.get("file_size_bytes")
+    return (
+        f"{entry['phase']:<12} {entry['rows']:>10,} {entry['wall_s']:>9.2f} {entry['cpu_s']:>9.2f} "
+        f"{entry['peak_rss_bytes'] / mb:>9.1f} {'-' if traced is None else f'{traced / mb:.1f}':>10} "
+        f"{'-' if size is None else f'{size / mb:.2f}':>9}"
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="catalog sizes in rows")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, help="phases to run (default: all, "
+                        "with the standard writer capped at 100k rows)")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON report path")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip the traced runs")
+    parser.add_argument("--compare", metavar="BASELINE", help="fail on regressions against a previous report")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown/growth (default 0.2)")
+    args = parser.parse_args(argv)
+
+    phases = args.phases or list(PHASES)
+    print(f"{'phase':<12} {'rows':>10} {'wall s':>9} {'cpu s':>9} {'RSS MB':>9} {'traced MB':>10} {'file MB':>9}")
+    results = []
+    for rows, phase in itertools.product(sorted(args.sizes), phases):
+        if not args.phases and rows > PHASE_MAX_ROWS.get(phase, rows):
+            continue
+        entry = run_benchmark(phase, rows, not args.no_tracemalloc)
+        results.append(entry)
+        print(_format_row(entry), flush=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+    print(f"Benchmark results: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
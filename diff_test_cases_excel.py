@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Diff two Partner Dashboard Test Cases workbooks
+Joins the Test Cases rows on Test Case ID and prints added, removed and changed cells and the Summary count changes
+"""
+
+import argparse
+import sys
+
+from testcases.diff import WorkbookDiff
+
+def _shorten(value, width=80):
+    return value if len(value) <= width else value[:width - 3] + "..."
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("old", help="workbook before the change")
+    parser.add_argument("new", help="workbook after the change")
+    parser.add_argument("--sheet", default="Test Cases", help="sheet to compare (default: Test Cases)")
+    parser.add_argument("--summary", action="store_true", help="print only the counts")
+    args = parser.parse_args(argv)
+
+    diff = WorkbookDiff(args.old, args.new, args.sheet)
+    for kind, case_id, detail in diff:
+        if args.summary:
+            continue
+        if kind == "changed":
+            print(f"~ {case_id}")
+            for header, (old, new) in detail.items():
+                print(f"    {header}: {_shorten(old)!r} -> {_shorten(new)!r}")
+        else:
+            name = " ".join(detail.get("Test Case Name", "").split())
+            print(f"{'+' if kind == 'added' else '-'} {case_id}  {detail.get('Module', '')}  {_shorten(name)}")
+
+    print(f"{diff.added} added, {diff.removed} removed, {diff.changed} changed")
+    if diff.field_changes:
+        print("Changed cells: " + ", ".join(f"{header} {count}" for header, count in diff.field_changes.most_common()))
+    for dimension, value, old, new in diff.summary_delta():
+        label = dimension if dimension == "Total" else f"{dimension} {value}"
+        print(f"  {label}: {old} -> {new} ({new - old:+d})")
+    return 1 if diff.added or diff.removed or diff.changed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
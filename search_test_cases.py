@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Full-text search over the Partner Dashboard test case catalog
+Updates the bigram search index under .cache/ and prints the best matches
+"""
+
+import argparse
+import sys
+import time
+
+from testcases.catalog import CATALOG_DIR
+from testcases.search import SEARCH_LIMIT, SearchIndex, search_index_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("query", nargs="+", help="terms that must all occur (any substring, Japanese included)")
+    parser.add_argument("--limit", type=int, default=SEARCH_LIMIT, help="matches to show (default 20)")
+    parser.add_argument("--catalog", default=CATALOG_DIR, help="catalog directory")
+    parser.add_argument("--index", help="index database (default: under .cache/)")
+    args = parser.parse_args(argv)
+
+    with SearchIndex(args.index or search_index_path(args.catalog)) as index:
+        start = time.perf_counter()
+        indexed, removed = index.update(args.catalog)
+        if indexed or removed:
+            print(f"Indexed {indexed} test cases, removed {removed} ({time.perf_counter() - start:.2f} s)",
+                  file=sys.stderr)
+        start = time.perf_counter()
+        matches = index.search(" ".join(args.query), args.limit)
+        elapsed = time.perf_counter() - start
+
+    for score, case_id, module, name in matches:
+        print(f"{-score:8.3f}  {case_id:<20} {module:<30} {name}")
+    print(f"{len(matches)} matches ({elapsed * 1000:.1f} ms)", file=sys.stderr)
+    return 0 if matches else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
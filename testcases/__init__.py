@@ -0,0 +1,22 @@
+"""
+Partner Dashboard test case tooling
+The test case catalog and everything built from it; create_test_cases_excel.py is the command line
+
+    catalog       test case files, TestCase records, validation, SummaryCube
+    writer        styles, Test Cases and Summary sheets, saving
+    reader        values-only xlsx reader
+    archive       zip compression and precompressed zip members
+    build         full, streaming and sharded builds
+    incremental   manifest-driven incremental builds
+    watch         watch mode
+    results       Playwright results and workbook merge-back
+    history       run history and the Trend sheet
+    traceability  links to the Playwright specs
+    fields        Order Hub field definitions
+    generate      test cases generated from field constraints
+    search        full-text search index
+    diff          workbook diff
+    exports       CSV, JSONL and Parquet exports
+    defaults      constants shared with the command line
+    profiling     per-phase build timings
+"""
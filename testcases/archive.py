@@ -0,0 +1,137 @@
+"""
+Zip archive helpers
+Compression settings, atomic file replacement and a writer for zips of precompressed members
+"""
+
+import os
+import stat
+import struct
+import tempfile
+import time
+import zipfile
+import zlib
+
+def zip_compression(compression=None):
+    """Return (compress_type, compresslevel) for a workbook compression setting
+
+    None is openpyxl's own (deflate at zlib's default level 6), 0 stores
+    members uncompressed and 1-9 are deflate levels, fastest to smallest.
+    """
+    if compression is None:
+        return zipfile.ZIP_DEFLATED, None
+    if compression == 0:
+        return zipfile.ZIP_STORED, None
+    if compression in range(1, 10):
+        return zipfile.ZIP_DEFLATED, compression
+    raise ValueError(f"compression must be None or 0-9, not {compression!r}")
+
+def replace_file(temp_path, filename):
+    """Move a finished temporary file over filename in one step
+
+    The file is flushed to disk first and given the permissions of the file
+    it replaces, or those a newly created file would have (mkstemp makes it
+    private).
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(filename).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(temp_path, mode)
+    with open(temp_path, "rb+") as f:
+        os.fsync(f.fileno())
+    os.replace(temp_path, filename)
+
+# ==================== PRECOMPRESSED MEMBERS ====================
+# An empty final deflate block; ends a stream of deflate_segment()s
+DEFLATE_END = b"\x03\x00"
+
+# Operators appending 2**n zero bytes to a CRC-32, built as needed
+_crc32_operators = []
+
+def deflate_segment(data, level=None):
+    """Compress data into a raw deflate segment that other segments can follow
+
+    The segment is sync-flushed rather than finished, so it ends on a byte
+    boundary without a final block: segments compressed separately join
+    into one valid stream once DEFLATE_END is appended.
+    """
+    compressor = zlib.compressobj(-1 if level is None else level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+def _gf2_times(matrix, vector):
+    total = 0
+    for row in matrix:
+        if not vector:
+            break
+        if vector & 1:
+            total ^= row
+        vector >>= 1
+    return total
+
+def _gf2_square(matrix):
+    return [_gf2_times(matrix, row) for row in matrix]
+
+def crc32_combine(crc1, crc2, length2):
+    """Return the CRC-32 of two byte strings joined, from their CRCs and the second one's length
+
+    zlib's crc32_combine(), which the zlib module does not expose.
+    """
+    operators = _crc32_operators
+    if not operators:
+        # One zero bit, squared to two, four and eight bits
+        matrix = [0xEDB88320] + [1 << n for n in range(31)]
+        for _ in range(3):
+            matrix = _gf2_square(matrix)
+        operators.append(matrix)
+    bit = 0
+    while length2:
+        if bit == len(operators):
+            operators.append(_gf2_square(operators[-1]))
+        if length2 & 1:
+            crc1 = _gf2_times(operators[bit], crc1)
+        length2 >>= 1
+        bit += 1
+    return crc1 ^ crc2
+
+def write_zip(filename, members, compress_type=zipfile.ZIP_DEFLATED):
+    """Write a zip of already compressed members to filename atomically
+
+    members is [(name, CRC-32, size, chunks)] where chunks hold the member's
+    data as compress_type stores it (raw deflate for ZIP_DEFLATED). zipfile
+    compresses whatever it is given, so the archive is laid out here.
+    Returns {name: offset of the member's data in the file}.
+    """
+    date_time = time.localtime()[:6]
+    dos_date = (date_time[0] - 1980) << 9 | date_time[1] << 5 | date_time[2]
+    dos_time = date_time[3] << 11 | date_time[4] << 5 | date_time[5] // 2
+    if len(members) > 0xFFFF:
+        raise ValueError(f"{len(members)} zip members need ZIP64, which write_zip does not support")
+    fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        offsets = {}
+        with os.fdopen(fd, "wb") as f:
+            directory = []
+            for name, crc, size, chunks in members:
+                encoded = name.encode("utf-8")
+                compressed = sum(map(len, chunks))
+                offset = f.tell()
+                if max(size, compressed, offset) > 0xFFFFFFFF:
+                    raise ValueError(f"{name} needs ZIP64, which write_zip does not support")
+                fields = (compress_type, dos_time, dos_date, crc, compressed, size, len(encoded), 0)
+                f.write(struct.pack("<4s5H3L2H", b"PK\x03\x04", 20, 0, *fields) + encoded)
+                offsets[name] = f.tell()
+                f.writelines(chunks)
+                directory.append(struct.pack("<4s6H3L5H2L", b"PK\x01\x02", 20, 20, 0, *fields, 0, 0, 0, 0, offset)
+                                 + encoded)
+            start = f.tell()
+            f.writelines(directory)
+            f.write(struct.pack("<4s4H2LH", b"PK\x05\x06", 0, 0, len(members), len(members), f.tell() - start,
+                                start, 0))
+        replace_file(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return offsets
@@ -0,0 +1,330 @@
+"""
+Workbook builds
+Full, streaming and sharded builds of the Test Cases workbook
+"""
+
+from contextlib import ExitStack
+from datetime import datetime, timezone
+import os
+import re
+import tempfile
+
+from .archive import zip_compression
+from .catalog import SummaryCube, catalog_modules, check_catalog, iter_test_cases
+from .exports import open_exporter, tee_exports
+from .history import TREND_RUNS, ResultHistory, collect_statuses, create_trend_sheet, history_path
+from .incremental import update_excel_file
+from .profiling import Profiler
+from .results import ingest_playwright_results
+from .traceability import AUTO_TESTS_DIR, Traceability, create_traceability_sheet, scan_spec_tree
+from .writer import (create_summary_sheet, new_skeleton, register_styles, row_xml_renderer, save_skeleton,
+                     save_workbook, style_ids, write_test_cases, write_test_cases_streaming, write_workbook_parts)
+
+# ==================== BUILD OPTIONS ====================
+class BuildOptions:
+    """How create_excel_file() builds the workbook, checked as a whole
+
+    mode is one of BUILD_MODES. conditional, summary_formulas, compression
+    and in_memory shape the workbook (see add_value_rules,
+    create_summary_sheet and save_workbook); results, exports, history with
+    trend_runs, traceability and profile add inputs and outputs; workers
+    are the processes of a sharded build. validate checks the catalog first
+    (see check_build_catalog). An option the mode cannot honor raises
+    ValueError instead of being ignored.
+    """
+
+    # What each mode writes: the whole workbook through openpyxl, the same
+    # in write-only mode, only what changed (update_excel_file), one sheet per
+    # Module (create_sharded_excel_file), or only the exports
+    BUILD_MODES = ("standard", "streaming", "incremental", "sharded", "export")
+
+    # Options each mode cannot honor
+    UNSUPPORTED = {
+        "incremental": ("in_memory", "history", "traceability"),
+        "sharded": ("in_memory", "results", "exports", "history", "traceability", "profile"),
+        "export": ("conditional", "summary_formulas", "compression", "in_memory", "history", "traceability")
+    }
+
+    def __init__(self, mode="standard", conditional=False, summary_formulas=False, compression=None,
+                 in_memory=False, results=None, validate=True, exports=None, history=None, trend_runs=None,
+                 traceability=False, profile=None, workers=None):
+        self.mode = mode
+        self.conditional = conditional
+        self.summary_formulas = summary_formulas
+        self.compression = compression
+        self.in_memory = in_memory
+        self.results = results
+        self.validate = validate
+        self.exports = exports
+        self.history = history
+        self.trend_runs = trend_runs
+        self.traceability = traceability
+        self.profile = profile
+        self.workers = workers
+        self.check()
+
+    def check(self):
+        """Raise ValueError for options that do not fit the mode or each other"""
+        if self.mode not in self.BUILD_MODES:
+            raise ValueError(f"Unknown build mode {self.mode!r}; expected one of {', '.join(self.BUILD_MODES)}")
+        unsupported = [name for name in self.UNSUPPORTED.get(self.mode, ()) if getattr(self, name)]
+        if unsupported:
+            raise ValueError(f"{self.mode} builds do not support {', '.join(unsupported)}")
+        if self.workers is not None and self.mode != "sharded":
+            raise ValueError("workers only apply to sharded builds")
+        if self.trend_runs is not None and not self.history:
+            raise ValueError("trend_runs needs history")
+        if self.mode == "export" and not self.exports:
+            raise ValueError("export builds need exports")
+        zip_compression(self.compression)
+
+def check_build_catalog(validate, cases=None):
+    """Raise CatalogError if the catalog a build reads has problems
+
+    validate is a bool or a catalog directory. True checks the default
+    catalog unless the build was given its cases, a directory checks that
+    catalog whatever the cases.
+    """
+    if validate is True:
+        if cases is None:
+            check_catalog()
+    elif validate:
+        check_catalog(validate)
+
+def create_excel_file(filename="Partner Dashboard Test Cases.xlsx", cases=None, options=None, **settings):
+    """Create Excel workbook with test cases
+
+    cases is any iterable of test case dicts and defaults to the whole
+    catalog, read lazily. options is a BuildOptions, or settings are its
+    keyword arguments. Returns filename, or None when only exports are
+    written.
+    """
+    if options is None:
+        options = BuildOptions(**settings)
+    elif settings:
+        raise TypeError("pass either options or BuildOptions settings, not both")
+    if options.mode == "sharded":
+        return create_sharded_excel_file(filename, cases, options.workers, options.conditional, options.validate,
+                                         options.compression, options.summary_formulas)
+    # History keeps runs over given cases, possibly a subset, out of the trend
+    partial = cases is not None
+    incremental = options.mode == "incremental"
+    history, traceability, exports = options.history, options.traceability, options.exports
+    profiler = Profiler.from_option(options.profile)
+    profiler.start()
+    try:
+        if options.validate:
+            with profiler.phase("validate"):
+                check_build_catalog(options.validate, cases)
+        
+        if options.results is not None:
+            with profiler.phase("results"):
+                cases = ingest_playwright_results(cases, options.results)
+        
+        with ExitStack() as stack:
+            if cases is not None or not incremental:
+                # Incremental builds re-read the catalog rather than keep it in memory
+                cases = profiler.iter("read", iter_test_cases() if cases is None else cases)
+            if exports:
+                if cases is None:
+                    cases = iter_test_cases()
+                exporters = [stack.enter_context(open_exporter(fmt, path)) for fmt, path in exports.items()]
+                cases = profiler.iter("export", tee_exports(cases, exporters))
+            extra_sheets = []
+            if history:
+                statuses = []
+                cases = collect_statuses(cases, statuses)
+                store = stack.enter_context(ResultHistory(history_path(filename) if history is True else history))
+                
+                def record_history(wb, cube):
+                    # Committed once the workbook is saved, so a failed save records nothing
+                    store.record_run(cube, statuses, os.path.basename(filename), partial=partial, commit=False)
+                    create_trend_sheet(wb, store, options.trend_runs or TREND_RUNS)
+                extra_sheets.append(record_history)
+            if traceability:
+                with profiler.phase("traceability"):
+                    trace = Traceability(scan_spec_tree(AUTO_TESTS_DIR if traceability is True else traceability))
+                cases = trace.collect(cases)
+                extra_sheets.append(lambda wb, cube: create_traceability_sheet(wb, trace))
+            
+            def before_save(wb, cube):
+                for create_sheet in extra_sheets:
+                    create_sheet(wb, cube)
+            if options.mode == "export":
+                total = sum(1 for _ in cases)
+                result = None
+            else:
+                result = _create_excel_file(filename, options, cases, profiler, before_save if extra_sheets else None)
+            if history:
+                store.commit()
+    finally:
+        profiler.stop()
+    for fmt, path in (exports or {}).items():
+        print(f"Exported {fmt}: {path}")
+    if options.mode == "export":
+        print(f"Total test cases: {total}")
+    if profiler.enabled:
+        print(profiler.summary())
+        for path in profiler.write(filename):
+            print(f"Timing report: {path}")
+    return result
+
+def _create_excel_file(filename, options, cases, profiler, before_save=None):
+    conditional = options.conditional
+    if options.mode == "incremental":
+        return update_excel_file(filename, cases, profiler, conditional, options.compression,
+                                 options.summary_formulas)
+    with profiler.phase("import"):
+        import openpyxl
+    
+    cube = SummaryCube()
+    if options.mode == "streaming":
+        with profiler.phase("setup"):
+            wb = openpyxl.Workbook(write_only=True)
+            register_styles(wb)
+            ws = wb.create_sheet("Test Cases", 0)
+        with profiler.phase("rows"):
+            write_test_cases_streaming(ws, cases, cube, conditional)
+    else:
+        with profiler.phase("setup"):
+            wb = openpyxl.Workbook()
+
+            # Remove default sheet
+            if 'Sheet' in wb.sheetnames:
+                wb.remove(wb['Sheet'])
+            register_styles(wb)
+
+            # Create main test cases sheet
+            ws = wb.create_sheet("Test Cases", 0)
+        with profiler.phase("rows"):
+            write_test_cases(ws, cases, cube, conditional)
+    
+    # Create summary sheet from the counts gathered while writing rows
+    with profiler.phase("summary"):
+        create_summary_sheet(wb, cube, options.summary_formulas)
+    if before_save is not None:
+        with profiler.phase("extra sheets"):
+            before_save(wb, cube)
+    
+    # Save workbook
+    with profiler.phase("save"):
+        save_workbook(wb, filename, options.compression, options.in_memory)
+    print(f"Excel file created: {filename}")
+    print(f"Total test cases: {cube.total}")
+    
+    return filename
+
+# ==================== SHARDED BUILD ====================
+# Characters Excel does not allow in sheet titles
+INVALID_TITLE_RE = re.compile(r"[\\/*?:\[\]]")
+
+def module_sheet_title(module, used):
+    """Return a valid, unused sheet title for a module and record it in used"""
+    base = INVALID_TITLE_RE.sub("-", module)[:31] or "Module"
+    title = base
+    number = 2
+    while title.casefold() in used:
+        suffix = f" ({number})"
+        title = base[:31 - len(suffix)] + suffix
+        number += 1
+    used.add(title.casefold())
+    return title
+
+def build_timestamp():
+    """Return the fixed timestamp stamped into reproducible builds
+
+    Honors SOURCE_DATE_EPOCH and otherwise uses the zip epoch (1980-01-01).
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.fromtimestamp(max(int(epoch), 315532800), tz=timezone.utc).replace(tzinfo=None)
+    return datetime(1980, 1, 1)
+
+def _render_module_rows(task):
+    """Render one module's rows; runs in a worker process
+
+    Returns the module's row XML and its SummaryCube cells.
+    """
+    module, cases, ids, conditional = task
+    if cases is None:
+        cases = iter_test_cases(modules=[module])
+    render = row_xml_renderer(ids, conditional)
+    cube = SummaryCube()
+    rows = []
+    for test_case in cases:
+        cube.add(test_case)
+        rows.append(render(test_case))
+    return b"".join(rows), cube.cells
+
+def create_sharded_excel_file(filename="Partner Dashboard Test Cases.xlsx", cases=None, workers=None,
+                              conditional=False, validate=True, compression=None, summary_formulas=False):
+    """Create the workbook with one sheet per Module, rendered in parallel
+
+    Each module's rows are serialized in a worker process. The Test Cases
+    sheet holds every row (module by module, in catalog order) and the
+    Summary covers them all. Rows are spooled to a temporary file in module
+    order and the zip is stamped with build_timestamp(), so the output is
+    byte-for-byte identical whatever the number of workers. conditional,
+    validate, compression and summary_formulas are as for BuildOptions.
+    """
+    check_build_catalog(validate, cases)
+    if cases is None:
+        # Workers read their own module from the catalog
+        tasks = [(module, None) for module, _ in catalog_modules()]
+    else:
+        grouped = {}
+        for test_case in cases:
+            grouped.setdefault(test_case.get("Module", "Unknown"), []).append(test_case)
+        tasks = list(grouped.items())
+    
+    wb = new_skeleton(conditional)
+    used = {"test cases", "summary"}
+    members = []
+    for module, _ in tasks:
+        ws = wb.create_sheet(module_sheet_title(module, used))
+        write_test_cases(ws, [], conditional=conditional)
+        members.append(ws)
+    ids = style_ids(wb)
+    
+    cube = SummaryCube()
+    spans = []
+    with tempfile.TemporaryFile() as spool:
+        jobs = [(module, module_cases, ids, conditional) for module, module_cases in tasks]
+        if workers == 1:
+            results = map(_render_module_rows, jobs)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=workers)
+            results = executor.map(_render_module_rows, jobs)
+        try:
+            for rows, cells in results:
+                spans.append((spool.tell(), len(rows), sum(cells.values())))
+                spool.write(rows)
+                cube.cells.update(cells)
+        finally:
+            if workers != 1:
+                executor.shutdown()
+        
+        size = spool.tell()
+        create_summary_sheet(wb, cube, summary_formulas)
+        timestamp = build_timestamp()
+        skeleton = save_skeleton(wb, timestamp)
+        
+        def read_span(start, length):
+            spool.seek(start)
+            while length > 0:
+                chunk = spool.read(min(length, 1 << 20))
+                length -= len(chunk)
+                yield chunk
+        
+        parts = {
+            ws.path.lstrip("/"): (count, read_span(start, length))
+            for ws, (start, length, count) in zip(members, spans)
+        }
+        parts[wb["Test Cases"].path.lstrip("/")] = (cube.total, read_span(0, size))
+        write_workbook_parts(skeleton, parts, filename, timestamp, compression)
+    
+    print(f"Excel file created: {filename}")
+    print(f"Total test cases: {cube.total} in {len(tasks)} module sheets")
+    
+    return filename
@@ -0,0 +1,340 @@
+"""
+Partner Dashboard test case catalog
+Reads, validates, counts and hashes the test cases kept under catalog/
+"""
+
+from collections import Counter
+from collections.abc import MutableMapping
+import hashlib
+import json
+import os
+import re
+import sys
+
+# Repository root, which the catalog, the Playwright project and the spec
+# workbooks are found relative to
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ==================== TEST CASE CATALOG ====================
+# Test cases live in catalog/ as one JSONL file per module (one test case per
+# line); catalog/index.json lists the modules and their files in sheet order.
+CATALOG_DIR = os.path.join(PROJECT_DIR, "catalog")
+
+# Derived data (indexes of source files) that can be rebuilt at any time
+CACHE_DIR = os.path.join(PROJECT_DIR, ".cache")
+
+class CatalogError(ValueError):
+    """A catalog line that cannot be read as a test case, or a catalog that fails validation"""
+
+def catalog_modules(catalog_dir=CATALOG_DIR):
+    """Return [(module, path)] for every module in the catalog, in order"""
+    with open(os.path.join(catalog_dir, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    return [(entry["module"], os.path.join(catalog_dir, entry["file"])) for entry in index["modules"]]
+
+def iter_test_cases(modules=None, where=None, catalog_dir=CATALOG_DIR):
+    """Yield test cases from the catalog one at a time
+
+    modules limits reading to the files of those modules; where is a
+    {field: value or collection of values} filter applied to each record as
+    it is read, so nothing outside the selection is ever kept in memory.
+    Test cases are TestCase records. A line that is not a test case object
+    or has a field outside HEADERS raises CatalogError naming its file and
+    line; validate_catalog() lists every problem at once.
+    """
+    filters = [
+        (field, {value} if isinstance(value, str) else set(value))
+        for field, value in (where or {}).items()
+    ]
+    for module, path in catalog_modules(catalog_dir):
+        if modules is not None and module not in modules:
+            continue
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    test_case = json.loads(line)
+                except ValueError as error:
+                    raise CatalogError(f"{path}:{line_number}: invalid JSON: {error}") from None
+                if not isinstance(test_case, dict):
+                    raise CatalogError(f"{path}:{line_number}: not a JSON object")
+                if all(test_case.get(field, "") in values for field, values in filters):
+                    try:
+                        test_case = TestCase(test_case)
+                    except KeyError as error:
+                        raise CatalogError(f"{path}:{line_number}: {error.args[0]}") from None
+                    yield test_case
+
+def load_test_cases(modules=None, where=None, catalog_dir=CATALOG_DIR):
+    """Return the selected test cases as a list"""
+    return list(iter_test_cases(modules, where, catalog_dir))
+
+# Column layout shared by every writer mode
+HEADERS = [
+    "Test Case ID", "Module", "Test Case Name", "Test Type",
+    "Priority", "Preconditions", "Test Steps", "Expected Results",
+    "Status", "Notes"
+]
+
+# Attribute name of every column in TestCase records
+FIELD_SLOTS = {header: header.lower().replace(" ", "_") for header in HEADERS}
+
+# Columns with a handful of distinct values; TestCase keeps one shared
+# (interned) string per value instead of a copy per record
+CATEGORICAL_FIELDS = ("Module", "Test Type", "Priority", "Status")
+
+class TestCase(MutableMapping):
+    """Compact test case record with the interface of a test case dict
+
+    Fields live in __slots__ instead of a per-record dict, and the
+    categorical columns are interned, so a large catalog costs a fraction of
+    the memory. test_case["Status"], get(), in, keys()/items(), assignment,
+    dict(test_case) and {**test_case} all work as they do on the dict it was
+    built from; fields missing there stay missing. Only HEADERS fields are
+    allowed.
+    """
+
+    __slots__ = tuple(FIELD_SLOTS.values())
+
+    def __init__(self, fields=(), **kwargs):
+        for header, value in dict(fields, **kwargs).items():
+            self[header] = value
+
+    def __getitem__(self, header):
+        try:
+            return getattr(self, FIELD_SLOTS[header])
+        except (KeyError, AttributeError):
+            raise KeyError(header) from None
+
+    def get(self, header, default=None):
+        slot = FIELD_SLOTS.get(header)
+        return default if slot is None else getattr(self, slot, default)
+
+    def __setitem__(self, header, value):
+        slot = FIELD_SLOTS.get(header)
+        if slot is None:
+            raise KeyError(f"{header!r} is not a test case field")
+        if header in CATEGORICAL_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        setattr(self, slot, value)
+
+    def __delitem__(self, header):
+        try:
+            delattr(self, FIELD_SLOTS[header])
+        except (KeyError, AttributeError):
+            raise KeyError(header) from None
+
+    def __contains__(self, header):
+        slot = FIELD_SLOTS.get(header)
+        return slot is not None and hasattr(self, slot)
+
+    def __iter__(self):
+        for header, slot in FIELD_SLOTS.items():
+            if hasattr(self, slot):
+                yield header
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return f"TestCase({dict(self)!r})"
+
+# Cell colors per value: (fill color, white bold font)
+PRIORITY_COLORS = {
+    "Critical": ("FF0000", True),
+    "High": ("FF9900", True),
+    "Medium": ("FFCC00", False),
+    "Low": ("FFFF99", False)
+}
+
+STATUS_COLORS = {
+    "Pass": ("00FF00", False),
+    "Fail": ("FF0000", True),
+    "Pending": ("FFFF00", False),
+    "Blocked": ("FF9900", False)
+}
+
+# ==================== SUMMARY COUNTS ====================
+# Fields the summary aggregates over, in cube key order
+SUMMARY_DIMENSIONS = ("Module", "Test Type", "Priority", "Status")
+
+class SummaryCube:
+    """Test case counts by Module x Test Type x Priority x Status
+
+    Filled in a single pass over the catalog; every count, roll-up and
+    cross-tab on the Summary sheet is answered from the cube, so dashboards
+    and CI gates can query the same numbers without opening the workbook:
+
+        cube = SummaryCube(iter_test_cases())
+        cube.counts("Status", where={"Module": "Dashboard"})
+        cube.pass_rate("Module")
+    """
+
+    def __init__(self, cases=()):
+        self.cells = Counter()
+        for test_case in cases:
+            self.add(test_case)
+
+    def add(self, test_case):
+        """Count one test case"""
+        get = test_case.get
+        self.cells[(get("Module", "Unknown"), get("Test Type", "Unknown"),
+                    get("Priority", "Unknown"), get("Status", "Unknown"))] += 1
+
+    @property
+    def total(self):
+        return sum(self.cells.values())
+
+    def _select(self, where):
+        """Yield (key, count) for the cells matching every {dimension: value} filter"""
+        filters = [(SUMMARY_DIMENSIONS.index(dimension), value)
+                   for dimension, value in (where or {}).items()]
+        for key, count in self.cells.items():
+            if all(key[axis] == value for axis, value in filters):
+                yield key, count
+
+    def counts(self, dimension, where=None):
+        """Return {value: count} for one dimension, optionally filtered"""
+        axis = SUMMARY_DIMENSIONS.index(dimension)
+        totals = Counter()
+        for key, count in self._select(where):
+            totals[key[axis]] += count
+        return dict(totals)
+
+    def crosstab(self, row_dimension, column_dimension, where=None):
+        """Return {row value: {column value: count}} for two dimensions"""
+        row_axis = SUMMARY_DIMENSIONS.index(row_dimension)
+        column_axis = SUMMARY_DIMENSIONS.index(column_dimension)
+        table = {}
+        for key, count in self._select(where):
+            row = table.setdefault(key[row_axis], {})
+            row[key[column_axis]] = row.get(key[column_axis], 0) + count
+        return table
+
+    def pass_rate(self, dimension="Module", where=None):
+        """Return {value: share of test cases with Status "Pass"} for one dimension"""
+        return {
+            value: statuses.get("Pass", 0) / sum(statuses.values())
+            for value, statuses in self.crosstab(dimension, "Status", where).items()
+        }
+
+    def to_dict(self):
+        """Return the cube as JSON-serializable data"""
+        return {
+            "total": self.total,
+            "counts": {dimension: self.counts(dimension) for dimension in SUMMARY_DIMENSIONS},
+            "cells": [
+                dict(zip(SUMMARY_DIMENSIONS, key), Count=count)
+                for key, count in sorted(self.cells.items())
+            ]
+        }
+
+# ==================== CATALOG VALIDATION ====================
+# Test Case IDs such as UI-DASH-001, TC-LOGIN-003 or E2E-NEG-001
+TEST_CASE_ID_RE = re.compile(r"\b[A-Z][A-Z0-9]*(?:-[A-Z][A-Z0-9]*)*-\d{3,}\b")
+
+TEST_TYPES = ("Functional", "UI", "API", "Integration", "E2E")
+
+# Allowed values of the categorical columns; anything else would open a new
+# Summary bucket
+ALLOWED_VALUES = {
+    "Test Type": TEST_TYPES,
+    "Priority": tuple(PRIORITY_COLORS),
+    "Status": tuple(STATUS_COLORS)
+}
+
+# Leading ID segments that stand for a test type (UI-DASH-001, INT-RITS-002);
+# E2E test cases are prefixed with their area instead (ORD-001, E2E-NEG-001)
+ID_TYPE_PREFIXES = {"UI": "UI", "API": "API", "TC": "Functional", "INT": "Integration"}
+
+# Fields that must be present and non-empty
+REQUIRED_FIELDS = ("Test Case ID", "Module", "Test Case Name", "Test Type", "Priority", "Status")
+
+def case_violations(test_case, module=None):
+    """Return the problems of one test case that can be seen without the others
+
+    module is the module whose catalog file the test case was read from.
+    """
+    problems = [f"unknown field {header!r}" for header in test_case if header not in FIELD_SLOTS]
+    problems.extend(f"missing {header}" for header in REQUIRED_FIELDS if not test_case.get(header))
+    for header, allowed in ALLOWED_VALUES.items():
+        value = test_case.get(header)
+        if value and value not in allowed:
+            problems.append(f"{header} {value!r} is not one of {', '.join(allowed)}")
+    if module is not None and test_case.get("Module") and test_case["Module"] != module:
+        problems.append(f"Module {test_case['Module']!r} does not match its catalog file ({module})")
+    
+    case_id = test_case.get("Test Case ID")
+    test_type = test_case.get("Test Type")
+    if case_id and not (isinstance(case_id, str) and TEST_CASE_ID_RE.fullmatch(case_id)):
+        problems.append(f"Test Case ID {case_id!r} does not follow the PREFIX-001 scheme")
+    elif case_id:
+        tag = case_id.split("-", 1)[0]
+        if tag in ID_TYPE_PREFIXES and test_type in TEST_TYPES and ID_TYPE_PREFIXES[tag] != test_type:
+            problems.append(f"Test Case ID {case_id!r} is prefixed {tag}- but Test Type is {test_type}")
+        elif tag not in ID_TYPE_PREFIXES and test_type in ID_TYPE_PREFIXES.values():
+            prefix = next(prefix for prefix, name in ID_TYPE_PREFIXES.items() if name == test_type)
+            problems.append(f"Test Case ID {case_id!r} should start with {prefix}- for Test Type {test_type}")
+    return problems
+
+def validate_catalog(catalog_dir=CATALOG_DIR):
+    """Return [(location, problem)] for every problem in the catalog files
+
+    One pass over the files: each line is parsed and checked on its own
+    (case_violations) and its ID is looked up in a hash index of the IDs seen
+    so far. location is "path:line".
+    """
+    violations = []
+    seen = {}
+    for module, path in catalog_modules(catalog_dir):
+        try:
+            f = open(path, encoding="utf-8")
+        except OSError as error:
+            violations.append((os.path.join(catalog_dir, "index.json"), f"{module}: {error.strerror}: {path}"))
+            continue
+        with f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                location = f"{path}:{line_number}"
+                try:
+                    test_case = json.loads(line)
+                except ValueError as error:
+                    violations.append((location, f"invalid JSON: {error}"))
+                    continue
+                if not isinstance(test_case, dict):
+                    violations.append((location, "not a JSON object"))
+                    continue
+                violations.extend((location, problem) for problem in case_violations(test_case, module))
+                case_id = test_case.get("Test Case ID")
+                if isinstance(case_id, str) and case_id:
+                    first = seen.setdefault(case_id, location)
+                    if first is not location:
+                        violations.append((location, f"duplicate Test Case ID {case_id!r} (first at {first})"))
+    return violations
+
+def check_catalog(catalog_dir=CATALOG_DIR):
+    """Raise CatalogError listing every catalog problem, if there are any"""
+    violations = validate_catalog(catalog_dir)
+    if violations:
+        lines = "\n".join(f"{location}: {problem}" for location, problem in violations)
+        raise CatalogError(f"Catalog has {len(violations)} problems:\n{lines}")
+
+# ==================== CONTENT HASHES ====================
+def data_hash(data):
+    """Return the content hash of bytes"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def case_hash(test_case):
+    """Return the content hash of a test case's HEADERS fields"""
+    values = [test_case.get(header, "") for header in HEADERS]
+    return data_hash(json.dumps(values, ensure_ascii=False).encode("utf-8"))
+
+def file_hash(path):
+    """Return the content hash of a file"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,25 @@
+"""
+Defaults
+Constants the command line needs without importing the modules that use them
+"""
+
+# Export formats and the file extension each one is usually written with.
+# "csv" is UTF-8 with a BOM so Excel detects the encoding; "csv-sjis" is
+# Shift_JIS (Windows code page 932) for Japanese Excel versions that assume it.
+EXPORT_FORMATS = {
+    "csv": ".csv",
+    "csv-sjis": ".csv",
+    "jsonl": ".jsonl",
+    "parquet": ".parquet"
+}
+
+# Runs shown on the Trend sheet
+TREND_RUNS = 10
+
+# Captures a profile can ask for besides the per-phase timings
+PROFILE_CAPTURES = ("cprofile", "tracemalloc")
+
+# Seconds between polls of the catalog files, and of quiet after the last
+# change before rebuilding, since editors often save in bursts
+WATCH_INTERVAL = 0.1
+WATCH_DEBOUNCE = 0.25
@@ -0,0 +1,133 @@
+"""
+Workbook diff
+Joins two workbooks' Test Cases rows on Test Case ID and reports what changed
+"""
+
+from collections import Counter
+from contextlib import ExitStack
+import heapq
+import json
+import os
+import tempfile
+import zlib
+
+from .catalog import HEADERS, SUMMARY_DIMENSIONS, SummaryCube
+from .reader import iter_workbook_records, sheet_part_size
+
+# Worksheet XML (uncompressed) of the old workbook joined in memory at once;
+# larger sheets are partitioned by Test Case ID hash and spilled to
+# temporary files first, so memory stays at about this much either way
+DIFF_PARTITION_BYTES = 32 * 1024 * 1024
+
+class WorkbookDiff:
+    """Row-by-row difference of two workbooks' Test Cases sheets, keyed on Test Case ID
+
+        diff = WorkbookDiff("before.xlsx", "after.xlsx")
+        for kind, case_id, detail in diff:
+            ...
+        diff.field_changes, diff.summary_delta()
+
+    Iterating streams both sheets once and hash-joins them: the old rows are
+    the build side, the new rows probe it. kind is "added" or "removed"
+    (detail is the row as {header: value}) or "changed" (detail is {header:
+    (old, new)} for the differing cells). Changes come in new-sheet order,
+    removed rows last in old-sheet order. The counts (added, removed,
+    changed, field_changes and the SummaryCube of each side) are complete
+    once iteration ends.
+
+    A sheet bigger than partition_bytes is joined as a grace hash join: both
+    sides are split into partitions by ID hash in temporary files, each pair
+    of partitions is joined on its own and the sorted per-partition results
+    are merged, so neither workbook is ever held in memory whole.
+    """
+
+    def __init__(self, old, new, sheet="Test Cases", partition_bytes=DIFF_PARTITION_BYTES):
+        self.old = old
+        self.new = new
+        self.sheet = sheet
+        self.partition_bytes = partition_bytes
+        self.added = self.removed = self.changed = 0
+        self.field_changes = Counter()
+        self.old_cube = SummaryCube()
+        self.new_cube = SummaryCube()
+
+    def _rows(self, filename, cube):
+        """Yield (row number, Test Case ID, record), counting every record in cube"""
+        for row_number, (case_id, record) in enumerate(iter_workbook_records(filename, self.sheet), 2):
+            cube.add(record)
+            yield row_number, case_id, record
+
+    def _join(self, old_rows, new_rows):
+        """Yield ((order key), change) for one partition, sorted by the order key"""
+        old = {case_id: (row_number, record) for row_number, case_id, record in old_rows}
+        for row_number, case_id, record in new_rows:
+            previous = old.pop(case_id, None)
+            if previous is None:
+                self.added += 1
+                yield (0, row_number), ("added", case_id, record)
+                continue
+            old_record = previous[1]
+            cells = {
+                header: (old_record.get(header, ""), record.get(header, ""))
+                for header in HEADERS
+                if old_record.get(header, "") != record.get(header, "")
+            }
+            if cells:
+                self.changed += 1
+                self.field_changes.update(cells.keys())
+                yield (0, row_number), ("changed", case_id, cells)
+        for case_id, (row_number, record) in old.items():
+            self.removed += 1
+            yield (1, row_number), ("removed", case_id, record)
+
+    def __iter__(self):
+        partitions = -(-sheet_part_size(self.old, self.sheet) // self.partition_bytes)
+        old_rows = self._rows(self.old, self.old_cube)
+        new_rows = self._rows(self.new, self.new_cube)
+        if partitions <= 1:
+            for _, change in self._join(old_rows, new_rows):
+                yield change
+            return
+        
+        with tempfile.TemporaryDirectory() as tmp, ExitStack() as stack:
+            def spill(rows, side):
+                files = [stack.enter_context(open(os.path.join(tmp, f"{side}-{index}.jsonl"), "w+", encoding="utf-8"))
+                         for index in range(partitions)]
+                for row in rows:
+                    files[zlib.crc32(row[1].encode("utf-8")) % partitions].write(json.dumps(row, ensure_ascii=False) + "\n")
+                return files
+            
+            def read_back(f):
+                f.seek(0)
+                return (json.loads(line) for line in f)
+            
+            old_files = spill(old_rows, "old")
+            new_files = spill(new_rows, "new")
+            results = []
+            for old_file, new_file in zip(old_files, new_files):
+                result = stack.enter_context(open(os.path.join(tmp, f"diff-{len(results)}.jsonl"), "w+", encoding="utf-8"))
+                for key, change in self._join(read_back(old_file), read_back(new_file)):
+                    result.write(json.dumps([key, change], ensure_ascii=False) + "\n")
+                results.append(read_back(result))
+                old_file.truncate(0)
+                new_file.truncate(0)
+            for _, (kind, case_id, detail) in heapq.merge(*results, key=lambda item: item[0]):
+                if kind == "changed":
+                    detail = {header: tuple(values) for header, values in detail.items()}
+                yield kind, case_id, detail
+
+    def summary_delta(self):
+        """Return [(dimension, value, old count, new count)] for every Summary count that changed
+
+        The total comes first as ("Total", "", old, new).
+        """
+        delta = []
+        if self.old_cube.total != self.new_cube.total:
+            delta.append(("Total", "", self.old_cube.total, self.new_cube.total))
+        for dimension in SUMMARY_DIMENSIONS:
+            old_counts = self.old_cube.counts(dimension)
+            new_counts = self.new_cube.counts(dimension)
+            for value in sorted(old_counts.keys() | new_counts.keys()):
+                if old_counts.get(value, 0) != new_counts.get(value, 0):
+                    delta.append((dimension, value, old_counts.get(value, 0), new_counts.get(value, 0)))
+        return delta
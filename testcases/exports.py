@@ -0,0 +1,163 @@
+"""
+Test case exports
+Streaming CSV, JSONL and Parquet writers for the catalog
+"""
+
+from contextlib import ExitStack
+import csv
+import json
+import os
+import tempfile
+
+from .archive import replace_file
+from .catalog import HEADERS, iter_test_cases
+from .defaults import EXPORT_FORMATS
+
+# Characters Shift_JIS cannot encode, mapped to the closest ones it can;
+# anything else unencodable becomes "?"
+SJIS_TRANSLATION = str.maketrans({"¥": "\\", "–": "-"})
+
+# Rows per Parquet row group
+PARQUET_BATCH_SIZE = 65536
+
+class _Exporter:
+    """Base for exporters: write() one test case at a time, close() when done
+
+    Subclasses open() their writer on temp_path; leaving the with block moves
+    it over path, or deletes it when an error is raised, so a failed export
+    (or a failed build it is part of) leaves no truncated file behind. A
+    writer that fails to open deletes it too.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        fd, self.temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        os.close(fd)
+        try:
+            self.open()
+        except BaseException:
+            os.remove(self.temp_path)
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        try:
+            self.close()
+            if exc_type is None:
+                replace_file(self.temp_path, self.path)
+        finally:
+            if os.path.exists(self.temp_path):
+                os.remove(self.temp_path)
+
+class _CsvExporter(_Exporter):
+
+    def __init__(self, path, encoding, translation=None):
+        self.encoding = encoding
+        self.translation = translation
+        super().__init__(path)
+
+    def open(self):
+        self.f = open(self.temp_path, "w", encoding=self.encoding, errors="replace", newline="")
+        try:
+            self.writer = csv.writer(self.f)
+            self.writer.writerow(HEADERS)
+        except BaseException:
+            self.f.close()
+            raise
+
+    def write(self, test_case):
+        row = [str(test_case.get(header, "")) for header in HEADERS]
+        if self.translation:
+            row = [value.translate(self.translation) for value in row]
+        self.writer.writerow(row)
+
+    def close(self):
+        self.f.close()
+
+class _JsonlExporter(_Exporter):
+
+    def open(self):
+        self.f = open(self.temp_path, "w", encoding="utf-8", newline="\n")
+
+    def write(self, test_case):
+        record = {header: test_case.get(header, "") for header in HEADERS}
+        self.f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.f.close()
+
+class _ParquetExporter(_Exporter):
+    """Columnar export; rows are buffered and flushed one row group at a time"""
+
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet export requires pyarrow (pip install pyarrow)") from None
+        self.pa = pyarrow
+        self.schema = pyarrow.schema([(header, pyarrow.string()) for header in HEADERS])
+        self.columns = {header: [] for header in HEADERS}
+        self.rows = 0
+        super().__init__(path)
+
+    def open(self):
+        self.writer = self.pa.parquet.ParquetWriter(self.temp_path, self.schema)
+
+    def write(self, test_case):
+        for header, column in self.columns.items():
+            value = test_case.get(header, "")
+            column.append(value if value is None else str(value))
+        self.rows += 1
+        if self.rows >= PARQUET_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pydict(self.columns, schema=self.schema))
+            for column in self.columns.values():
+                column.clear()
+            self.rows = 0
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+def open_exporter(fmt, path):
+    """Return an exporter writing the HEADERS columns of test cases to path in one of EXPORT_FORMATS"""
+    if fmt == "csv":
+        return _CsvExporter(path, "utf-8-sig")
+    if fmt == "csv-sjis":
+        return _CsvExporter(path, "cp932", SJIS_TRANSLATION)
+    if fmt == "jsonl":
+        return _JsonlExporter(path)
+    if fmt == "parquet":
+        return _ParquetExporter(path)
+    raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+
+def tee_exports(cases, exporters):
+    """Yield cases unchanged, writing each one to every exporter on the way"""
+    for test_case in cases:
+        for exporter in exporters:
+            exporter.write(test_case)
+        yield test_case
+
+def export_test_cases(exports, cases=None):
+    """Write test cases (the catalog by default) to every {format: path} in exports
+
+    The test cases are read once and fanned out to all writers; a failed
+    export leaves no partly written file.
+    """
+    if cases is None:
+        cases = iter_test_cases()
+    count = 0
+    with ExitStack() as stack:
+        exporters = [stack.enter_context(open_exporter(fmt, path)) for fmt, path in exports.items()]
+        for _ in tee_exports(cases, exporters):
+            count += 1
+    for fmt, path in exports.items():
+        print(f"Exported {fmt}: {path}")
+    print(f"Total test cases: {count}")
+    return count
@@ -0,0 +1,201 @@
+"""
+Order Hub field definitions
+Extracts and caches the screens' field definitions from the naming and field-definition spec
+"""
+
+import json
+import os
+import re
+import tempfile
+import unicodedata
+
+from .catalog import CACHE_DIR, PROJECT_DIR, file_hash
+from .reader import iter_workbook_values
+
+# Order Hub naming and field-definition spec: one sheet per screen
+FIELD_DEFINITIONS = os.path.join(PROJECT_DIR, "Order Hub：名称・項目定義書.xlsx")
+FIELD_INDEX_VERSION = 1
+
+# Header texts of the spec's columns; a sheet without a field name column
+# (status tables, function lists) holds no field definitions
+FIELD_COLUMNS = {
+    "no": ("No.", "No", "№"),
+    "field": ("項目名", "項目名称", "OrderHub名称"),
+    "description": ("内容", "説明"),
+    "required": ("必須項目", "必須"),
+    "status": ("状況",)
+}
+# Rows searched for the column headers
+FIELD_HEADER_ROWS = 5
+
+# Sheet titles carry a version tag such as 【最終版】 or 【旧】; untagged and
+# these tags are the current definitions
+CURRENT_VERSIONS = ("", "最終版", "最新版")
+SHEET_TAG_RE = re.compile(r"^\s*【([^】]*)】\s*")
+
+# The spec has no type or length columns; both are inferred from the
+# (NFKC-normalized) field name, falling back to the description for the
+# input widget types. First match wins.
+FIELD_TYPE_PATTERNS = [
+    ("email", re.compile(r"メール|mail", re.IGNORECASE), False),
+    ("phone", re.compile(r"電話|TEL|FAX", re.IGNORECASE), False),
+    ("postal_code", re.compile(r"郵便|〒"), False),
+    ("datetime", re.compile(r"日時"), False),
+    ("date", re.compile(r"日付|年月日|日$"), False),
+    ("amount", re.compile(r"金額|価格|料金|円"), False),
+    ("number", re.compile(r"件数|数量|日数|数値|数字"), False),
+    ("kana", re.compile(r"カナ|フリガナ"), False),
+    ("checkbox", re.compile(r"チェックボックス"), True),
+    ("select", re.compile(r"プルダウン|ドロップダウン|ラジオ|選択|^\s*\d+\s*[:：]", re.MULTILINE), True)
+]
+FIELD_LENGTH_RE = re.compile(r"(\d+)\s*(?:文字|桁|バイト|byte)", re.IGNORECASE)
+REQUIRED_VALUES = {"必須": True, "表示必須": True, "◎": True, "○": True, "〇": True, "任意": False}
+
+def _field_columns(rows):
+    """Return ({key: column}, header row number) for a sheet, or (None, None)"""
+    for row_number, row in enumerate(rows, 1):
+        headers = [value.strip() for value in row]
+        columns = {}
+        for key, names in FIELD_COLUMNS.items():
+            for column, header in enumerate(headers):
+                # Descriptions are the first matching column right of the field name
+                if header in names and (key != "description" or column > columns.get("field", -1)):
+                    columns.setdefault(key, column)
+        if "field" in columns:
+            return columns, row_number
+        if row_number >= FIELD_HEADER_ROWS:
+            break
+    return None, None
+
+def infer_field_type(name, description=""):
+    """Return the field type guessed from a field's name and description"""
+    for field_type, pattern, from_description in FIELD_TYPE_PATTERNS:
+        if pattern.search(name) or (from_description and pattern.search(description)):
+            return field_type
+    return "text"
+
+def extract_field_definitions(path=FIELD_DEFINITIONS):
+    """Yield one dict per field defined in the Order Hub spec workbook
+
+    Sheets are streamed with iter_workbook_values(); each yields its fields
+    in order as {"screen", "version", "section", "no", "field", "parent",
+    "type", "length", "required", "status", "description", "sheet", "row"}.
+    required is True/False where the spec says so and None otherwise; length
+    is None unless the text states one.
+    """
+    for sheet, rows in iter_workbook_values(path):
+        tag = SHEET_TAG_RE.match(sheet)
+        screen = unicodedata.normalize("NFKC", sheet[tag.end():] if tag else sheet).strip()
+        version = tag.group(1) if tag else ""
+        rows = iter(rows)
+        columns, header_row = _field_columns(rows)
+        if columns is None:
+            continue
+        
+        section = parent = ""
+        for row_number, row in enumerate(rows, header_row + 1):
+            cells = {key: row[column].strip() if column < len(row) else "" for key, column in columns.items()}
+            raw_name = cells["field"]
+            if not raw_name or raw_name == "-":
+                # A lone label left of the field names starts a section
+                labels = [value.strip() for value in row[:columns["field"]] if value.strip()]
+                if len(labels) == 1 and not labels[0].replace(".", "").isdigit() and not any(
+                        value.strip() for value in row[columns["field"] + 1:]):
+                    section = labels[0]
+                continue
+            name = unicodedata.normalize("NFKC", raw_name)
+            child = name.startswith("┗")
+            name = name.lstrip("┗").strip()
+            if not child:
+                parent = name
+            description = unicodedata.normalize("NFKC", cells.get("description", ""))
+            length = FIELD_LENGTH_RE.search(name) or FIELD_LENGTH_RE.search(description)
+            required = REQUIRED_VALUES.get(cells.get("required", "").split("\n")[0].strip())
+            no = cells.get("no", "")
+            yield {
+                "screen": screen,
+                "version": version,
+                "section": section,
+                "no": no[:-2] if no.endswith(".0") else no,
+                "field": name,
+                "parent": parent if child else "",
+                "type": infer_field_type(name, description),
+                "length": int(length.group(1)) if length else None,
+                "required": required,
+                "status": cells.get("status", ""),
+                "description": description,
+                "sheet": sheet,
+                "row": row_number
+            }
+
+class FieldIndex:
+    """Field definitions indexed by screen and field name
+
+        index = load_field_index()
+        index.lookup("注文管理>注文一覧", "注文番号")["type"]
+        index.find("注文番号")  # every current screen with that field
+
+    Only current definitions (CURRENT_VERSIONS) are indexed unless
+    include_obsolete is set; the full list stays in fields.
+    """
+
+    def __init__(self, fields, include_obsolete=False):
+        self.fields = fields
+        self.by_screen = {}
+        self.by_name = {}
+        for field in fields:
+            if include_obsolete or field["version"] in CURRENT_VERSIONS:
+                self.by_screen.setdefault(field["screen"], {}).setdefault(field["field"], field)
+                self.by_name.setdefault(field["field"], []).append(field)
+
+    def screens(self):
+        return list(self.by_screen)
+
+    def for_screen(self, screen):
+        """Return the fields of one screen, in spec order"""
+        return list(self.by_screen.get(screen, {}).values())
+
+    def lookup(self, screen, name):
+        """Return the definition of one field on one screen, or None
+
+        A name defined twice on a screen (a list column that is also a
+        search item) returns the first definition; find() returns both.
+        """
+        return self.by_screen.get(screen, {}).get(unicodedata.normalize("NFKC", name).strip())
+
+    def find(self, name):
+        """Return the definitions of a field name on every screen"""
+        return self.by_name.get(unicodedata.normalize("NFKC", name).strip(), [])
+
+def field_index_cache_path(path):
+    """Return where the field index of a spec workbook is cached"""
+    return os.path.join(CACHE_DIR, os.path.basename(path) + ".fields.json")
+
+def load_field_index(path=FIELD_DEFINITIONS, include_obsolete=False):
+    """Return the FieldIndex of a spec workbook, extracting it only when the workbook changed
+
+    The extracted fields are cached as JSON under CACHE_DIR together with
+    the workbook's content hash (and FIELD_INDEX_VERSION); a different hash
+    re-extracts and rewrites the cache.
+    """
+    cache_path = field_index_cache_path(path)
+    source_hash = file_hash(path)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == FIELD_INDEX_VERSION and cached.get("source") == source_hash:
+            return FieldIndex(cached["fields"], include_obsolete)
+    except (OSError, ValueError):
+        pass
+    
+    fields = list(extract_field_definitions(path))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".json", dir=CACHE_DIR)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": FIELD_INDEX_VERSION, "source": source_hash, "fields": fields}, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return FieldIndex(fields, include_obsolete)
@@ -0,0 +1,238 @@
+"""
+Generated test cases
+Functional validation cases derived from the Order Hub field constraints
+"""
+
+from collections import Counter
+import itertools
+import re
+
+from .catalog import TestCase, data_hash
+from .fields import load_field_index
+
+# Screens whose input fields get generated cases: {area: (module, ID code)}
+GENERATED_SCREEN_AREAS = {"注文管理": ("Order Management", "ORD"), "顧客管理": ("Customer Management", "CUST")}
+GENERATED_SCREENS = ("注文管理>注文新規登録", "顧客管理>新規会員登録、編集")
+GENERATED_STRENGTH = 2
+# Digits of the number ending a generated Test Case ID
+GENERATED_ID_DIGITS = 8
+
+# Enumerated options in a description: "1:本売場、2:催事場" or "┗送付、不要"
+ENUM_ITEM_RE = re.compile(r"(?:^|[、,])\s*\d+\s*:\s*([^、,\n]+)")
+ENUM_LIST_RE = re.compile(r"^\s*┗\s*(.+)$", re.MULTILINE)
+
+# Representative values of each field type: ([(label, value)] valid, [(label, value)] invalid)
+FIELD_TYPE_VALUES = {
+    "email": ([("valid address", "test.user@example.com")], [("no @", "test.user.example.com")]),
+    "phone": ([("valid number", "03-1234-5678")], [("letters", "03-ABCD-5678")]),
+    "postal_code": ([("valid code", "100-0001")], [("too few digits", "100-01")]),
+    "datetime": ([("valid date and time", "2025/01/31 23:59")], [("invalid time", "2025/01/31 24:00")]),
+    "date": ([("valid date", "2025/01/31"), ("leap day", "2024/02/29")], [("nonexistent date", "2025/02/30")]),
+    "amount": ([("zero", "0"), ("typical amount", "10000")], [("negative", "-1"), ("not a number", "abc")]),
+    "number": ([("zero", "0"), ("typical number", "5")], [("negative", "-1"), ("not a number", "abc")]),
+    "kana": ([("full-width katakana", "テストタロウ")], [("hiragana", "てすとたろう")]),
+    "checkbox": ([("checked", "ON"), ("unchecked", "OFF")], []),
+    "select": ([("first option", "(first option)")], []),
+    "text": ([("typical text", "テスト")], [])
+}
+
+def field_enumeration(description):
+    """Return the options a field description enumerates, or []"""
+    options = ENUM_ITEM_RE.findall(description)
+    if not options:
+        match = ENUM_LIST_RE.search(description)
+        options = re.split(r"[、,]", match.group(1)) if match else []
+    return [option.strip() for option in options if option.strip()]
+
+def field_constraints(field):
+    """Return the generator's constraints for a field definition
+
+    {"field", "type", "length", "required", "values"}: values are the
+    enumerated options of a select field ([] when the spec lists none), and
+    multi-line names (address blocks) are joined into one line.
+    Plain dicts of this shape can be passed to generate_test_cases() directly.
+    """
+    return {
+        "field": " ".join(field["field"].split()),
+        "type": field["type"],
+        "length": field["length"],
+        "required": field["required"],
+        "values": field_enumeration(field["description"]) if field["type"] == "select" else []
+    }
+
+def is_constrained(constraints):
+    """Return whether a field has anything to test beyond typing some text"""
+    return (constraints["type"] != "text" or constraints["length"] is not None
+            or constraints["required"] is not None or bool(constraints.get("values")))
+
+def value_classes(constraints):
+    """Return [(label, value, valid)] test values of one field
+
+    Lengths give the 1-character, maximum and maximum+1 boundaries, required
+    fields get an empty (invalid) value and optional ones an empty (valid)
+    value, enumerations every option; the rest comes from FIELD_TYPE_VALUES.
+    """
+    field_type = constraints["type"] if constraints["type"] in FIELD_TYPE_VALUES else "text"
+    valid, invalid = FIELD_TYPE_VALUES[field_type]
+    if constraints.get("values"):
+        valid = [(f"option {option}", option) for option in constraints["values"]]
+    length = constraints["length"]
+    if length and field_type in ("text", "kana"):
+        char = "ア" if field_type == "kana" else "あ"
+        valid = [("1 character", char), (f"max length ({length})", char * length)]
+        invalid = invalid + [(f"over max length ({length + 1})", char * (length + 1))]
+    classes = [(label, value, True) for label, value in valid]
+    if constraints["required"] is not None:
+        classes.append(("empty", "", not constraints["required"]))
+    classes.extend((label, value, False) for label, value in invalid)
+    return classes
+
+def covering_rows(sizes, strength=GENERATED_STRENGTH):
+    """Yield rows of value indexes that together cover every strength-way combination
+
+    sizes is the number of values of each column. Rows are built one at a
+    time by a greedy (AETG-style) search: each starts from the first
+    combination still uncovered and fills the other columns with the value
+    completing the most uncovered combinations. Memory is the set of
+    uncovered combinations, sum(prod(sizes of t columns)) over the column
+    t-subsets, never the cartesian product; strength 1 covers each value
+    once, strength >= len(sizes) is the full product.
+    """
+    columns = range(len(sizes))
+    strength = min(strength, len(sizes))
+    if strength < 1 or not all(sizes):
+        return
+
+    def combinations():
+        for subset in itertools.combinations(columns, strength):
+            for values in itertools.product(*(range(sizes[column]) for column in subset)):
+                yield tuple(zip(subset, values))
+
+    uncovered = set(combinations())
+    # Uncovered combinations per (column, value), to break ties
+    remaining = Counter(item for combination in uncovered for item in combination)
+    pending = combinations()
+    while uncovered:
+        seed = next(combination for combination in pending if combination in uncovered)
+        row = [None] * len(sizes)
+        for column, value in seed:
+            row[column] = value
+        assigned = [column for column, _ in seed]
+        for column in columns:
+            if row[column] is not None:
+                continue
+            best, best_gain = 0, None
+            for value in range(sizes[column]):
+                gain = 0
+                for others in itertools.combinations(assigned, strength - 1):
+                    combination = [(other, row[other]) for other in others]
+                    combination.append((column, value))
+                    combination.sort()
+                    gain += tuple(combination) in uncovered
+                gain = (gain, remaining[column, value])
+                if best_gain is None or gain > best_gain:
+                    best, best_gain = value, gain
+            row[column] = best
+            assigned.append(column)
+        for subset in itertools.combinations(columns, strength):
+            combination = tuple((column, row[column]) for column in subset)
+            if combination in uncovered:
+                uncovered.remove(combination)
+                remaining.subtract(combination)
+        yield tuple(row)
+
+def _sample_text(value):
+    if not value:
+        return '""'
+    if len(value) > 10 and value == value[0] * len(value):
+        return f'"{value[0]}" x {len(value)}'
+    return f'"{value}"'
+
+def generated_case_id(code, key, used):
+    """Return the Test Case ID of a generated case: TC-<code>-GEN- and a number hashed from key
+
+    key names what the case tests (screen, fields and value classes), so
+    adding, removing or reordering fields leaves the IDs of the other cases
+    unchanged. used holds the IDs given so far; a hash collision is resolved
+    by rehashing.
+    """
+    text = "\x1f".join(key)
+    while True:
+        number = int(data_hash(text.encode("utf-8")), 16) % 10 ** GENERATED_ID_DIGITS
+        case_id = f"TC-{code}-GEN-{number:0{GENERATED_ID_DIGITS}d}"
+        if case_id not in used:
+            used.add(case_id)
+            return case_id
+        text += "\x1f"
+
+def _generated_case(case_id, module, name, priority, screen, entries, expected, notes):
+    steps = [f"1. Open {screen}"]
+    steps += [f"{number}. {field}: {label} ({_sample_text(value)})"
+              for number, (field, label, value) in enumerate(entries, 2)]
+    steps.append(f"{len(steps) + 1}. Submit the form")
+    return TestCase({
+        "Test Case ID": case_id,
+        "Module": module,
+        "Test Case Name": name,
+        "Test Type": "Functional",
+        "Priority": priority,
+        "Preconditions": f"User logged in, {screen} open",
+        "Test Steps": "\n".join(steps),
+        "Expected Results": expected,
+        "Status": "Pending",
+        "Notes": notes
+    })
+
+def generate_test_cases(screens=GENERATED_SCREENS, strength=GENERATED_STRENGTH, index=None, fields=None):
+    """Yield Functional validation test cases generated from field constraints
+
+    For each screen: one case per covering_rows() row over the valid values
+    of its constrained fields, then one case per invalid value (a single
+    fault, every other field valid). Cases are TestCase records with IDs
+    like TC-ORD-GEN-04718263 (see generated_case_id), produced lazily one
+    screen at a time, so they can go straight into a writer:
+
+        create_excel_file(mode="streaming", cases=itertools.chain(iter_test_cases(), generate_test_cases()))
+
+    Screens come from the field index (load_field_index() unless given);
+    fields is an optional {screen: [constraints]} to use instead of the spec.
+    """
+    used = set()
+    for screen in screens:
+        area = screen.split(">")[0]
+        if area not in GENERATED_SCREEN_AREAS:
+            raise ValueError(f"No module for generated cases of {screen!r}")
+        module, code = GENERATED_SCREEN_AREAS[area]
+        if fields is not None:
+            constraints = fields[screen]
+        else:
+            if index is None:
+                index = load_field_index()
+            constraints = [field_constraints(field) for field in index.for_screen(screen)]
+        constraints = [field for field in constraints if is_constrained(field)]
+        if not constraints:
+            continue
+        title = screen.split(">")[-1]
+        classes = [value_classes(field) for field in constraints]
+        valid = [[value_class for value_class in field_classes if value_class[2]] for field_classes in classes]
+        for number, row in enumerate(covering_rows([len(values) for values in valid], strength), 1):
+            entries = [(field["field"], *values[choice][:2]) for field, values, choice in zip(constraints, valid, row)]
+            key = [screen, "valid", *sorted(f"{field}={label}" for field, label, _ in entries)]
+            yield _generated_case(
+                generated_case_id(code, key, used), module, f"{title} valid input combination {number}", "Medium",
+                screen, entries, "Form is accepted without validation errors and the entered values are saved",
+                f"Generated: {len(constraints)} fields, strength {strength}"
+            )
+        for position, field in enumerate(constraints):
+            for label, value, is_valid in classes[position]:
+                if is_valid:
+                    continue
+                entries = [(other["field"], *valid[other_position][0][:2])
+                           for other_position, other in enumerate(constraints)]
+                entries[position] = (field["field"], label, value)
+                yield _generated_case(
+                    generated_case_id(code, [screen, field["field"], label], used), module,
+                    f"{title} {field['field']} rejects {label}", "High" if field["required"] else "Medium",
+                    screen, entries, f"Validation error is shown for {field['field']} and nothing is saved",
+                    "Generated: invalid value"
+                )
@@ -0,0 +1,185 @@
+"""
+Result history
+Records every run's statuses in SQLite and charts the pass rate trend
+"""
+
+from datetime import datetime, timezone
+import os
+import sqlite3
+
+from .defaults import TREND_RUNS
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_at TEXT NOT NULL,
+    workbook TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS runs_by_time ON runs (run_at);
+CREATE TABLE IF NOT EXISTS module_counts (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    module TEXT NOT NULL,
+    status TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, module, status)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS status_changes (
+    case_id TEXT NOT NULL,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    module TEXT NOT NULL,
+    status TEXT NOT NULL,
+    PRIMARY KEY (case_id, run_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS status_changes_by_run ON status_changes (run_id, case_id);
+"""
+
+def history_path(filename):
+    """Return the path of the result history database kept next to filename"""
+    return os.path.splitext(filename)[0] + ".history.sqlite3"
+
+def collect_statuses(cases, statuses):
+    """Yield cases unchanged, appending (Test Case ID, Module, Status) of each to statuses"""
+    for test_case in cases:
+        statuses.append((test_case.get("Test Case ID", ""), test_case.get("Module", "Unknown"),
+                         test_case.get("Status", "Unknown")))
+        yield test_case
+
+class ResultHistory:
+    """Append-only SQLite store of test case statuses, run by run
+
+    Every run records its Status counts per Module (module_counts) and, per
+    test case, only a Status that differs from the one last recorded
+    (status_changes, keyed by Test Case ID then run), or that was last
+    recorded TREND_RUNS runs ago, so that the last TREND_RUNS runs hold the
+    Status of every test case in them. Trend queries read a handful of count
+    rows per run, the last statuses only the last runs' rows and a case's
+    history is one index range, so all stay fast however many nightly runs
+    accumulate. Partial runs, over a subset
+    of the catalog, are kept out of the trend.
+    """
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.executescript(HISTORY_SCHEMA)
+        if "partial" not in [column for _, column, *_ in self.db.execute("PRAGMA table_info(runs)")]:
+            # Databases written before partial runs were told apart
+            self.db.execute("ALTER TABLE runs ADD COLUMN partial INTEGER NOT NULL DEFAULT 0")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the database, dropping a run recorded with commit=False and not committed"""
+        self.db.close()
+
+    def commit(self):
+        self.db.commit()
+
+    def latest_statuses(self, runs=TREND_RUNS):
+        """Return {Test Case ID: last Status recorded} over the last runs runs"""
+        first = self.db.execute("SELECT id FROM runs ORDER BY id DESC LIMIT 1 OFFSET ?", (runs - 1,)).fetchone()
+        # In run order, so a case's last row wins; a range of status_changes_by_run
+        return dict(self.db.execute("SELECT case_id, status FROM status_changes WHERE run_id >= ? ORDER BY run_id",
+                                    (first[0] if first else 0,)))
+
+    def record_run(self, cube, statuses, workbook="", run_at=None, partial=False, commit=True):
+        """Record one run and return its id
+
+        cube holds the run's counts; statuses is an iterable of (Test Case
+        ID, Module, Status). run_at defaults to now (UTC). A partial run is
+        left out of runs() and pass_rates(). With commit=False the run stays
+        in an open transaction, seen by this store's queries, until commit().
+        """
+        run_at = (run_at or datetime.now(timezone.utc)).isoformat(timespec="seconds")
+        previous = self.latest_statuses(TREND_RUNS - 1)
+        try:
+            run_id = self.db.execute(
+                "INSERT INTO runs (run_at, workbook, total, partial) VALUES (?, ?, ?, ?)",
+                (run_at, workbook, cube.total, int(partial))).lastrowid
+            self.db.executemany(
+                "INSERT INTO module_counts VALUES (?, ?, ?, ?)",
+                [(run_id, module, status, count)
+                 for module, counts in cube.crosstab("Module", "Status").items()
+                 for status, count in counts.items()])
+            self.db.executemany(
+                "INSERT OR REPLACE INTO status_changes VALUES (?, ?, ?, ?)",
+                ((case_id, run_id, module, status)
+                 for case_id, module, status in statuses
+                 if case_id and previous.get(case_id) != status))
+        except BaseException:
+            self.db.rollback()
+            raise
+        if commit:
+            self.db.commit()
+        return run_id
+
+    def runs(self, limit=TREND_RUNS):
+        """Return [(run id, run time)] of the last limit full runs, oldest first"""
+        return self.db.execute(
+            "SELECT id, run_at FROM runs WHERE NOT partial ORDER BY run_at DESC, id DESC LIMIT ?",
+            (limit,)).fetchall()[::-1]
+
+    def pass_rates(self, runs=TREND_RUNS, by_module=True):
+        """Return (runs, {Module: [pass rate or None, ...]}) over the last runs
+
+        Rates line up with the returned [(run id, run time)], oldest first;
+        None marks a run without that Module. With by_module=False there is a
+        single "All Modules" entry.
+        """
+        recent = self.runs(runs)
+        position = {run_id: index for index, (run_id, _) in enumerate(recent)}
+        group = "module" if by_module else "'All Modules'"
+        rates = {}
+        rows = self.db.execute(
+            f"SELECT run_id, {group}, sum(count), sum(CASE WHEN status = 'Pass' THEN count ELSE 0 END) "
+            f"FROM module_counts WHERE run_id IN ({', '.join('?' * len(recent))}) GROUP BY run_id, {group}",
+            list(position))
+        for run_id, module, total, passed in rows:
+            rates.setdefault(module, [None] * len(recent))[position[run_id]] = passed / total if total else None
+        return recent, dict(sorted(rates.items()))
+
+    def case_history(self, case_id):
+        """Return [(run time, Status)] for every Status change of one test case, oldest first"""
+        changes = []
+        for run_at, status in self.db.execute(
+                "SELECT runs.run_at, status FROM status_changes JOIN runs ON runs.id = run_id "
+                "WHERE case_id = ? ORDER BY run_id", (case_id,)):
+            # Skip a Status recorded again only because it was unchanged for long
+            if not changes or changes[-1][1] != status:
+                changes.append((run_at, status))
+        return changes
+
+def create_trend_sheet(wb, history, runs=TREND_RUNS):
+    """Create the Trend sheet: pass rate per Module over the last runs in history
+
+    Rows are appended in order, as on the Summary sheet.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    
+    recent, rates = history.pass_rates(runs)
+    _, overall = history.pass_rates(runs, by_module=False)
+    
+    ws = wb.create_sheet("Trend", 2)
+    ws.column_dimensions['A'].width = 25
+    for index in range(len(recent)):
+        ws.column_dimensions[get_column_letter(index + 2)].width = 17
+    
+    def trend_cell(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+    
+    ws.append([trend_cell(f"Pass Rate Trend - Last {len(recent)} Runs", "Summary Title")])
+    ws.merged_cells.add('A1:D1')
+    ws.append([])
+    ws.append([trend_cell(value, "Summary Header")
+               for value in ("Module", *(run_at[:16].replace("T", " ") for _, run_at in recent))])
+    for module, module_rates in [*rates.items(), *overall.items()]:
+        ws.append([module, *(None if rate is None else trend_cell(rate, "Summary Percent")
+                             for rate in module_rates)])
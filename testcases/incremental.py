@@ -0,0 +1,234 @@
+"""
+Incremental build
+Rebuilds only the parts of the workbook whose test cases changed
+"""
+
+import io
+import json
+import os
+import zipfile
+import zlib
+
+from .archive import DEFLATE_END, crc32_combine, deflate_segment, write_zip, zip_compression
+from .catalog import (HEADERS, PRIORITY_COLORS, STATUS_COLORS, SummaryCube, case_hash, data_hash, file_hash,
+                      iter_test_cases)
+from .profiling import Profiler
+from .writer import (COLUMN_WIDTHS, STYLE_SPECS, create_summary_sheet, new_skeleton, row_xml_renderer, save_skeleton,
+                     split_sheet_xml, style_ids)
+
+# Bump when the workbook layout changes so incremental builds start over
+BUILD_VERSION = 2
+
+# Average rows per separately compressed block of the Test Cases sheet
+BLOCK_ROWS = 1024
+
+def manifest_path(filename):
+    """Return the path of the incremental build manifest kept next to filename"""
+    return os.path.splitext(filename)[0] + ".manifest.json"
+
+def layout_hash(conditional=False, summary_formulas=False, compression=None):
+    """Return a hash of everything besides the test cases that shapes the workbook"""
+    layout = [BUILD_VERSION, HEADERS, COLUMN_WIDTHS, PRIORITY_COLORS, STATUS_COLORS, STYLE_SPECS, conditional,
+              summary_formulas, zip_compression(compression)]
+    return data_hash(json.dumps(layout, sort_keys=True).encode("utf-8"))
+
+def sheet_hashes(hashes, cube):
+    """Return {sheet: content hash} from the [Test Case ID, case hash] of the rows and the Summary counts"""
+    return {
+        "Test Cases": data_hash(json.dumps(hashes).encode("utf-8")),
+        "Summary": data_hash(json.dumps(cube.to_dict(), sort_keys=True).encode("utf-8"))
+    }
+
+def read_manifest(filename, layout=None):
+    """Return the manifest describing filename, or None if it is missing or stale
+
+    A manifest only counts when the workbook on disk is still the one it was
+    written for (and, given a layout hash, was built with that layout); a
+    workbook edited or replaced since then forces a full build.
+    """
+    try:
+        with open(manifest_path(filename), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if layout is not None and manifest.get("layout") != layout:
+            return None
+        if manifest.get("file") != file_hash(filename):
+            return None
+    except (OSError, ValueError):
+        return None
+    return manifest
+
+def load_blocks(filename, manifest):
+    """Return {case hashes: block} for the row blocks of the workbook a manifest describes
+
+    The compressed segments are read straight from where the manifest says
+    they are in the file; nothing is decompressed.
+    """
+    entries = manifest["blocks"] if manifest is not None else []
+    if not entries:
+        return {}
+    start = entries[0][3]
+    with open(filename, "rb") as f:
+        f.seek(start)
+        data = f.read(entries[-1][3] + entries[-1][4] - start)
+    return {
+        tuple(key): (tuple(key), crc, size, data[offset - start:offset - start + length])
+        for key, crc, size, offset, length in entries
+    }
+
+def row_groups(cases):
+    """Yield lists of (test case, case hash) for consecutive test cases kept in one block
+
+    A group ends after a test case whose hash makes it a boundary (one in
+    BLOCK_ROWS on average, and at most 4 x BLOCK_ROWS rows in), so
+    boundaries depend on the test cases around them rather than on
+    positions: an insertion or an edit changes the groups next to it and
+    leaves the others as they were. A group also ends where a Module
+    starts, so catalog order gives the watcher's per-module groups. A
+    module coming back after others (cases not in Module order) does not end
+    one, which would leave blocks of a row or two that compress badly.
+    """
+    group = []
+    module = None
+    seen = set()
+    for test_case in cases:
+        digest = case_hash(test_case)
+        if test_case.get("Module") != module:
+            module = test_case.get("Module")
+            if group and module not in seen:
+                yield group
+                group = []
+            seen.add(module)
+        group.append((test_case, digest))
+        if int(digest[:8], 16) % BLOCK_ROWS == 0 or len(group) >= 4 * BLOCK_ROWS:
+            yield group
+            group = []
+    if group:
+        yield group
+
+class RowBlocks:
+    """Renders test cases into compressed blocks of Test Cases rows
+
+    A block is (case hashes, CRC-32, size, segment): segment is the rows'
+    XML as one deflate_segment() (as is when stored), so blocks are joined
+    into the sheet without being decompressed, and a block whose case
+    hashes are found among the previous blocks is reused rather than
+    rendered again. rendered counts the rows rendered so far.
+    """
+
+    def __init__(self, conditional=False, compression=None):
+        self.compress_type, self.level = zip_compression(compression)
+        self.render = row_xml_renderer(style_ids(new_skeleton(conditional)), conditional)
+        self.rendered = 0
+
+    def compress(self, data):
+        return data if self.compress_type == zipfile.ZIP_STORED else deflate_segment(data, self.level)
+
+    def blocks(self, cases, previous, hashes, cube=None):
+        """Return the blocks of cases, reusing those in previous ({case hashes: block})
+
+        [Test Case ID, case hash] of every test case is appended to hashes
+        and, given a cube, the test cases are counted in it.
+        """
+        blocks = []
+        for group in row_groups(cases):
+            key = tuple(digest for _, digest in group)
+            hashes.extend([test_case.get("Test Case ID", ""), digest] for test_case, digest in group)
+            if cube is not None:
+                for test_case, _ in group:
+                    cube.add(test_case)
+            block = previous.get(key)
+            if block is None:
+                rows = b"".join(self.render(test_case) for test_case, _ in group)
+                block = (key, zlib.crc32(rows), len(rows), self.compress(rows))
+                self.rendered += len(group)
+            blocks.append(block)
+        return blocks
+
+def save_row_blocks(filename, blocks, hashes, cube, conditional=False, summary_formulas=False, compression=None):
+    """Write the workbook with the Test Cases rows of blocks, then its manifest
+
+    Everything but the rows is small and rebuilt each time. The manifest
+    records where every block's segment lies in the written file, so the
+    next build can copy the unchanged ones (see load_blocks()). compression
+    must be the one the blocks were made with.
+    """
+    compress_type, level = zip_compression(compression)
+    deflated = compress_type == zipfile.ZIP_DEFLATED
+    
+    def chunks(*segments):
+        return [*segments, DEFLATE_END] if deflated else list(segments)
+    
+    def compress(data):
+        return deflate_segment(data, level) if deflated else data
+    
+    wb = new_skeleton(conditional)
+    # Register the cell formats the rows refer to
+    style_ids(wb)
+    create_summary_sheet(wb, cube, summary_formulas)
+    skeleton = save_skeleton(wb)
+    member = wb["Test Cases"].path.lstrip("/")
+    
+    members = []
+    with zipfile.ZipFile(io.BytesIO(skeleton)) as zin:
+        for name in zin.namelist():
+            data = zin.read(name)
+            if name != member:
+                members.append((name, zlib.crc32(data), len(data), chunks(compress(data))))
+                continue
+            head, tail = split_sheet_xml(data, cube.total)
+            head_segment = compress(head)
+            crc, size = zlib.crc32(head), len(head)
+            for _, block_crc, block_size, _ in blocks:
+                crc, size = crc32_combine(crc, block_crc, block_size), size + block_size
+            crc, size = crc32_combine(crc, zlib.crc32(tail), len(tail)), size + len(tail)
+            members.append((name, crc, size, chunks(head_segment, *(segment for *_, segment in blocks),
+                                                    compress(tail))))
+    offset = write_zip(filename, members, compress_type)[member] + len(head_segment)
+    
+    entries = []
+    for key, crc, size, segment in blocks:
+        entries.append([list(key), crc, size, offset, len(segment)])
+        offset += len(segment)
+    manifest = {
+        "version": BUILD_VERSION,
+        "layout": layout_hash(conditional, summary_formulas, compression),
+        "file": file_hash(filename),
+        "sheets": sheet_hashes(hashes, cube),
+        "blocks": entries
+    }
+    with open(manifest_path(filename), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+def update_excel_file(filename="Partner Dashboard Test Cases.xlsx", cases=None, profiler=None, conditional=False,
+                      compression=None, summary_formulas=False):
+    """Bring the workbook up to date, rebuilding only what changed
+
+    The Test Cases rows are kept in compressed blocks (see RowBlocks) that a
+    manifest next to the workbook locates, with a content hash per sheet.
+    When nothing changed the workbook is left alone. Otherwise the small
+    parts (styles, header, Summary) are rebuilt, the blocks of changed test
+    cases rendered and compressed, and the other blocks copied from the
+    previous workbook as they are. compression is as for zip_compression(),
+    summary_formulas as for create_summary_sheet().
+    """
+    if profiler is None:
+        profiler = Profiler(enabled=False)
+    cases = profiler.iter("read", iter_test_cases() if cases is None else cases)
+    previous = read_manifest(filename, layout_hash(conditional, summary_formulas, compression))
+    
+    store = RowBlocks(conditional, compression)
+    cube = SummaryCube()
+    hashes = []
+    with profiler.phase("rows"):
+        blocks = store.blocks(cases, load_blocks(filename, previous), hashes, cube)
+    if previous is not None and previous["sheets"] == sheet_hashes(hashes, cube):
+        print(f"Excel file up to date: {filename}")
+        print(f"Total test cases: {cube.total}")
+        return filename
+    
+    with profiler.phase("save"):
+        save_row_blocks(filename, blocks, hashes, cube, conditional, summary_formulas, compression)
+    print(f"Excel file created: {filename}")
+    print(f"Total test cases: {cube.total} ({store.rendered} rows rendered, {cube.total - store.rendered} reused)")
+    
+    return filename
@@ -0,0 +1,173 @@
+"""
+Build profiling
+Per-phase timings, allocation counts and optional cProfile/tracemalloc captures
+"""
+
+from contextlib import contextmanager
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .defaults import PROFILE_CAPTURES
+
+# Read when create_excel_file(profile=None): "1" for timings only, or a
+# comma-separated list of captures such as "cprofile,tracemalloc"
+PROFILE_ENV = "TEST_CASES_PROFILE"
+
+class Profiler:
+    """Per-phase wall/CPU timers and allocation counts for one build
+
+    Phases nest and time is charged to the innermost running phase only, so
+    the phases of a report add up to its total. allocated_blocks is the net
+    change in live memory blocks (sys.getallocatedblocks()). With cprofile
+    the whole build is also profiled with cProfile, and with trace the peak
+    traced memory (tracemalloc) of every phase is recorded. A disabled
+    profiler does nothing and costs nothing.
+    """
+
+    def __init__(self, enabled=True, cprofile=False, trace=False):
+        self.enabled = enabled
+        self.profile = cProfile.Profile() if enabled and cprofile else None
+        self.trace = enabled and trace
+        self.phases = {}
+        self.stack = []
+        self.started = self.stopped = self.mark = None
+        self._owns_trace = False
+
+    @classmethod
+    def from_option(cls, profile):
+        """Return the profiler for a profile option
+
+        profile is a bool, or capture names from PROFILE_CAPTURES (a
+        comma-separated string or a collection; "1" or "timings" for
+        timings only). None reads PROFILE_ENV.
+        """
+        if profile is None:
+            profile = os.environ.get(PROFILE_ENV, "")
+        if isinstance(profile, bool):
+            return cls(profile)
+        if isinstance(profile, str):
+            profile = [name.strip() for name in profile.split(",")]
+        names = {name.lower() for name in profile if name and name != "0"}
+        unknown = names - {"1", "timings", *PROFILE_CAPTURES}
+        if unknown:
+            raise ValueError(f"Unknown profile option {', '.join(sorted(unknown))}; "
+                             f"expected timings or {', '.join(PROFILE_CAPTURES)}")
+        return cls(bool(names), "cprofile" in names, "tracemalloc" in names)
+
+    @staticmethod
+    def _snapshot():
+        return time.perf_counter(), time.process_time(), sys.getallocatedblocks()
+
+    def _stats(self, name):
+        return self.phases.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "allocated_blocks": 0})
+
+    def _switch(self):
+        # Charge everything since the last switch to the running phase
+        now = self._snapshot()
+        if self.stack:
+            stats = self.phases[self.stack[-1]]
+            stats["wall_s"] += now[0] - self.mark[0]
+            stats["cpu_s"] += now[1] - self.mark[1]
+            stats["allocated_blocks"] += now[2] - self.mark[2]
+            if self.trace:
+                stats["traced_peak_bytes"] = max(stats.get("traced_peak_bytes", 0), tracemalloc.get_traced_memory()[1])
+        if self.trace:
+            tracemalloc.reset_peak()
+        self.mark = now
+
+    def start(self):
+        if not self.enabled:
+            return
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_trace = True
+        if self.profile:
+            self.profile.enable()
+        self.started = self.mark = self._snapshot()
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self._switch()
+        if self.profile:
+            self.profile.disable()
+        if self._owns_trace:
+            tracemalloc.stop()
+        self.stopped = self._snapshot()
+
+    @contextmanager
+    def phase(self, name):
+        """Time the body of a with statement as the named phase"""
+        if not self.enabled:
+            yield
+            return
+        self._switch()
+        self._stats(name)["calls"] += 1
+        self.stack.append(name)
+        try:
+            yield
+        finally:
+            self._switch()
+            self.stack.pop()
+
+    def iter(self, name, iterable):
+        """Return iterable with the time spent producing each item charged to the named phase"""
+        if not self.enabled:
+            return iterable
+        return self._iter(name, iter(iterable))
+
+    def _iter(self, name, iterator):
+        stats = self._stats(name)
+        while True:
+            self._switch()
+            stats["calls"] += 1
+            self.stack.append(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._switch()
+                self.stack.pop()
+            yield item
+
+    def report(self):
+        """Return the timings as a JSON-serializable dict"""
+        total = {
+            "wall_s": round(self.stopped[0] - self.started[0], 6),
+            "cpu_s": round(self.stopped[1] - self.started[1], 6),
+            "allocated_blocks": self.stopped[2] - self.started[2]
+        }
+        phases = {
+            name: {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+            for name, stats in self.phases.items()
+        }
+        return {
+            "captures": [name for name, on in zip(PROFILE_CAPTURES, (self.profile, self.trace)) if on],
+            "total": total,
+            "phases": phases,
+            "unaccounted_wall_s": round(total["wall_s"] - sum(stats["wall_s"] for stats in self.phases.values()), 6)
+        }
+
+    def summary(self):
+        """Return a one-line summary of where the time went"""
+        report = self.report()
+        phases = sorted(report["phases"].items(), key=lambda item: item[1]["wall_s"], reverse=True)
+        parts = ", ".join(f"{name} {stats['wall_s']:.2f}s" for name, stats in phases)
+        total = report["total"]
+        return f"Timings: {parts} (total {total['wall_s']:.2f}s wall, {total['cpu_s']:.2f}s CPU)"
+
+    def write(self, filename):
+        """Write the timing report (and cProfile stats) next to filename; return their paths"""
+        base = os.path.splitext(filename)[0]
+        paths = [base + ".timings.json"]
+        with open(paths[0], "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        if self.profile:
+            paths.append(base + ".prof")
+            self.profile.dump_stats(paths[1])
+        return paths
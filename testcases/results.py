@@ -0,0 +1,375 @@
+"""
+Test results
+Sets Status and Notes from Playwright JSON reports and merges tester edits back into the catalog
+"""
+
+import json
+import os
+import re
+import tempfile
+
+from .catalog import CATALOG_DIR, PROJECT_DIR, TEST_CASE_ID_RE, case_violations, catalog_modules, iter_test_cases
+from .reader import read_workbook
+
+# Written by the json reporter configured in auto/playwright.config.ts
+PLAYWRIGHT_RESULTS = os.path.join(PROJECT_DIR, "auto", "test-results", "results.json")
+
+# Playwright test outcomes from worst to best, and the Status each one sets
+PLAYWRIGHT_STATUS = {
+    "unexpected": "Fail",
+    "flaky": "Pass",
+    "expected": "Pass",
+    "skipped": None
+}
+
+# Start of the Notes line holding a run summary
+PLAYWRIGHT_NOTE = "Playwright: "
+
+def normalize_title(title):
+    """Return a test title as compared when matching: whitespace collapsed, case folded"""
+    return " ".join(title.split()).casefold()
+
+def spec_links(titles, tags=()):
+    """Return (Test Case IDs, normalized title or None) linking a spec to test cases
+
+    A spec is linked to every ID found in its describe/test titles or tags,
+    e.g. test('UI-DASH-001 header title') or { tag: '@UI-DASH-001' }; a
+    spec without IDs is linked by a test title equal to a Test Case Name.
+    """
+    ids = list(dict.fromkeys(TEST_CASE_ID_RE.findall(" ".join([*titles, *tags]))))
+    return ids, None if ids or not titles else normalize_title(titles[-1])
+
+class PlaywrightResults:
+    """Playwright runs by the test case they are linked to (see spec_links())
+
+    Looked up one test case at a time, so cases can stream past. A spec
+    naming only IDs outside the catalog is therefore not linked by its title.
+    """
+
+    def __init__(self):
+        self.by_id = {}
+        self.by_title = {}
+
+    def add(self, ids, title, run):
+        for case_id in ids:
+            self.by_id.setdefault(case_id, []).append(run)
+        if title is not None:
+            self.by_title.setdefault(title, []).append(run)
+
+    def runs(self, test_case):
+        """Return [(project, outcome, retries)] of the specs linked to a test case"""
+        return (self.by_id.get(test_case.get("Test Case ID", ""), [])
+                + self.by_title.get(normalize_title(test_case.get("Test Case Name", "")), []))
+
+class _JsonReader:
+    """Incremental reader over a JSON text stream
+
+    The caller walks containers with items()/elements() and decodes the
+    values it needs with value(); only the value being decoded is ever held
+    in memory, not the whole document.
+    """
+
+    _decoder = json.JSONDecoder()
+    _whitespace = re.compile(r"\s*")
+    _number = re.compile(r"[-+0-9.eE]*")
+
+    def __init__(self, f, chunk_size=1 << 20):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+
+    def _fill(self, size):
+        """Append at least size more characters to the buffer; False at end of stream"""
+        data = self.f.read(max(size, self.chunk_size))
+        if not data:
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or "" at end of stream"""
+        while True:
+            self.pos = self._whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {self.buffer[self.pos:self.pos + 20]!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode and return the next complete JSON value"""
+        if self.peek() in "-0123456789":
+            # A number reaching the buffer end may continue in the next chunk
+            while (self._number.match(self.buffer, self.pos).end() == len(self.buffer)
+                   and self._fill(self.chunk_size)):
+                pass
+        while True:
+            try:
+                value, self.pos = self._decoder.raw_decode(self.buffer, self.pos)
+                return value
+            except json.JSONDecodeError:
+                # The value runs past the buffer; double what is buffered and retry
+                if not self._fill(len(self.buffer) - self.pos):
+                    raise
+
+    def items(self):
+        """Yield the keys of the object at the current position
+
+        The caller must consume each key's value before asking for the next.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() != ",":
+                break
+            self.pos += 1
+        self.expect("}")
+
+    def elements(self):
+        """Yield once per element of the array at the current position
+
+        The caller must consume each element before asking for the next.
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.peek() != ",":
+                break
+            self.pos += 1
+        self.expect("]")
+
+def iter_playwright_specs(path):
+    """Yield (title path, spec) for every spec in a Playwright JSON report
+
+    The suite tree is walked incrementally and each spec object is decoded on
+    its own, so memory stays bounded by the largest single spec however big
+    the report is.
+    """
+    with open(path, encoding="utf-8") as f:
+        reader = _JsonReader(f)
+        for key in reader.items():
+            if key == "suites":
+                yield from _iter_suite_specs(reader, [])
+            else:
+                reader.value()
+
+def _iter_suite_specs(reader, titles):
+    for _ in reader.elements():
+        suite_titles = titles
+        for key in reader.items():
+            if key == "title":
+                suite_titles = titles + [reader.value()]
+            elif key == "specs":
+                for _ in reader.elements():
+                    yield suite_titles, reader.value()
+            elif key == "suites":
+                yield from _iter_suite_specs(reader, suite_titles)
+            else:
+                reader.value()
+
+def read_playwright_report(path):
+    """Return [(spec key, title path, tags, runs)] for every spec in one Playwright JSON report
+
+    runs is [(project, outcome, retries)]: outcome is Playwright's per-test
+    status (expected, unexpected, flaky or skipped) and retries the number of
+    retries it took. The spec key is Playwright's spec id (stable across
+    shards and reruns), or its file and title path in reports without one.
+    Reads the report on its own so that shards can be read in worker
+    processes.
+    """
+    specs = []
+    for titles, spec in iter_playwright_specs(path):
+        titles = [*titles, spec.get("title", "")]
+        key = spec.get("id") or "\x1f".join([spec.get("file", ""), str(spec.get("line", "")), *titles])
+        runs = [
+            (test.get("projectName", ""), test.get("status", "skipped"), max(len(test.get("results", [])) - 1, 0))
+            for test in spec.get("tests", [])
+        ]
+        specs.append((key, titles, spec.get("tags", []), runs))
+    return specs
+
+def playwright_report_paths(paths):
+    """Return the report files of paths: one path or a list, directories standing for every *.json below them
+
+    A directory's reports are ordered by modification time, so a rerun shard
+    comes after the run it repeats.
+    """
+    report_paths = []
+    for path in [paths] if isinstance(paths, (str, os.PathLike)) else paths:
+        if os.path.isdir(path):
+            found = [os.path.join(root, name)
+                     for root, _, names in os.walk(path) for name in names if name.endswith(".json")]
+            report_paths.extend(sorted(found, key=lambda report: (os.path.getmtime(report), report)))
+        else:
+            report_paths.append(os.fspath(path))
+    return report_paths
+
+def _link_report(path):
+    """Return (spec count, [(spec key, spec_links(), runs)] for the linked specs) of one report"""
+    specs = read_playwright_report(path)
+    linked = []
+    for key, titles, tags, runs in specs:
+        links = spec_links(titles, tags)
+        if links != ([], None):
+            linked.append((key, links, runs))
+    return len(specs), linked
+
+def read_playwright_results(paths, workers=None):
+    """Return the PlaywrightResults of Playwright JSON reports
+
+    paths is one report, a list of reports or directories of shard reports.
+    Reports are parsed and their specs linked concurrently in up to workers
+    processes (one per report by default, capped at the CPU count), so wall
+    time follows the largest shard. Their specs are merged by spec key and
+    project; a spec found in several reports (a rerun shard) keeps its
+    outcome from the last of them.
+    """
+    report_paths = playwright_report_paths(paths)
+    workers = min(workers or os.cpu_count() or 1, len(report_paths))
+    if workers <= 1:
+        reports = map(_link_report, report_paths)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+        reports = executor.map(_link_report, report_paths)
+    
+    merged = {}
+    try:
+        for path, (specs, linked) in zip(report_paths, reports):
+            for key, links, runs in linked:
+                for project, outcome, retries in runs:
+                    merged[key, project] = (links, outcome, retries)
+            print(f"Playwright results: {path} ({len(linked)} of {specs} specs linked to test cases)")
+    finally:
+        if workers > 1:
+            executor.shutdown()
+    
+    results = PlaywrightResults()
+    for (_, project), ((case_ids, title), outcome, retries) in merged.items():
+        results.add(case_ids, title, (project, outcome, retries))
+    return results
+
+def summarize_runs(runs):
+    """Return (Status or None, note) for the Playwright runs of one test case
+
+    Status is decided by the worst outcome; None (all skipped) keeps the
+    catalog Status. An outcome outside PLAYWRIGHT_STATUS (e.g. interrupted)
+    counts as skipped. Retried and flaky runs are spelled out in the note.
+    """
+    rank = {outcome: number for number, outcome in enumerate(PLAYWRIGHT_STATUS)}
+    worst = min((outcome for _, outcome, _ in runs), key=lambda outcome: rank.get(outcome, rank["skipped"]))
+    groups = {}
+    for project, outcome, retries in runs:
+        groups.setdefault((outcome, retries), []).append(project or "default")
+    parts = []
+    for (outcome, retries), projects in groups.items():
+        where = ", ".join(dict.fromkeys(projects))
+        if outcome == "flaky":
+            parts.append(f"flaky on {where} (passed on retry {retries})")
+        elif outcome == "unexpected":
+            parts.append(f"failed on {where}" + (f" after {retries} retries" if retries else ""))
+        elif outcome == "expected":
+            parts.append(f"passed on {where}")
+        else:
+            parts.append(f"{outcome} on {where}")
+    return PLAYWRIGHT_STATUS.get(worst), PLAYWRIGHT_NOTE + "; ".join(parts)
+
+def apply_playwright_results(cases, results):
+    """Yield test cases with Status and Notes set from PlaywrightResults
+
+    The catalog's own notes are kept ahead of the run summary, which
+    replaces the summary of an earlier run merged back from a workbook.
+    """
+    for test_case in cases:
+        runs = results.runs(test_case)
+        if runs:
+            status, note = summarize_runs(runs)
+            test_case = dict(test_case)
+            if status:
+                test_case["Status"] = status
+            notes = "\n".join(line for line in test_case.get("Notes", "").splitlines()
+                               if not line.startswith(PLAYWRIGHT_NOTE))
+            test_case["Notes"] = f"{notes}\n{note}" if notes else note
+        yield test_case
+
+def ingest_playwright_results(cases=None, paths=PLAYWRIGHT_RESULTS, workers=None):
+    """Return cases (the catalog by default) with Playwright outcomes applied
+
+    paths is one report path, a list of them or directories of shard
+    reports; see read_playwright_results(). The reports are read first and
+    cases looked up as they are iterated.
+    """
+    results = read_playwright_results(paths, workers)
+    return apply_playwright_results(iter_test_cases() if cases is None else cases, results)
+
+# Columns testers fill in by hand in the generated workbook
+MANUAL_FIELDS = ("Status", "Notes")
+
+def apply_workbook_records(cases, records, fields=MANUAL_FIELDS):
+    """Yield test cases with fields taken from the workbook records of the same ID"""
+    for test_case in cases:
+        record = records.get(test_case.get("Test Case ID", ""))
+        if record:
+            updates = {field: record[field] for field in fields if field in record}
+            if any(test_case.get(field, "") != value for field, value in updates.items()):
+                test_case = {**test_case, **updates}
+        yield test_case
+
+def merge_workbook_results(filename="Partner Dashboard Test Cases.xlsx", fields=MANUAL_FIELDS,
+                           catalog_dir=CATALOG_DIR):
+    """Copy manually edited fields from a workbook back into the catalog files
+
+    Only module files with changed test cases are rewritten (atomically).
+    An edit that would make a test case fail validation (e.g. a Status of
+    "Passed") is reported and the test case left as it was. Returns the
+    number of test cases updated.
+    """
+    records = read_workbook(filename)
+    updated = rejected = 0
+    for module, path in catalog_modules(catalog_dir):
+        lines = []
+        changed = 0
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if line.strip():
+                    test_case = json.loads(line)
+                    merged = next(apply_workbook_records([test_case], records, fields))
+                    if merged is not test_case:
+                        known = case_violations(test_case, module)
+                        problems = [problem for problem in case_violations(merged, module) if problem not in known]
+                        for problem in problems:
+                            print(f"{path}:{line_number}: skipped {merged['Test Case ID']}: {problem}")
+                        if problems:
+                            rejected += 1
+                        else:
+                            line = json.dumps(merged, ensure_ascii=False) + "\n"
+                            changed += 1
+                lines.append(line)
+        if changed:
+            fd, tmp_path = tempfile.mkstemp(dir=catalog_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                    f.writelines(lines)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+            print(f"Updated {changed} test cases in {os.path.basename(path)} ({module})")
+        updated += changed
+    print(f"Merged {updated} of {len(records)} workbook test cases into the catalog"
+          + (f", skipped {rejected} with invalid values" if rejected else ""))
+    return updated
@@ -0,0 +1,220 @@
+"""
+Catalog search
+Persistent full-text index of the test cases in SQLite FTS5
+"""
+
+import json
+import os
+import sqlite3
+import unicodedata
+import zlib
+
+from .catalog import CACHE_DIR, CATALOG_DIR, case_hash, catalog_modules, data_hash, file_hash
+
+# Full-text index of the catalog in SQLite FTS5. Text is indexed as
+# overlapping character bigrams, so Japanese without spaces is searchable by
+# any substring: a query is the phrase of its own bigrams. FTS5 tokenizers
+# can't be written in Python, so bigrams are passed as two-character words
+# to the ascii tokenizer, which keeps every non-ASCII character; ASCII, which
+# it would split on, is shifted into the Plane 15 private use area first.
+SEARCH_FIELDS = ("Test Case Name", "Preconditions", "Test Steps", "Expected Results", "Notes")
+# bm25 weight of each SEARCH_FIELDS column
+SEARCH_WEIGHTS = (2.0, 1.0, 1.0, 1.0, 0.5)
+SEARCH_INDEX_VERSION = 1
+SEARCH_LIMIT = 20
+
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cases (
+    id INTEGER PRIMARY KEY,
+    case_id TEXT NOT NULL UNIQUE,
+    module TEXT NOT NULL,
+    path TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    fields BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cases_by_path ON cases (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS grams USING fts5(
+    name, preconditions, steps, expected, notes, content='', tokenize='ascii'
+);
+"""
+
+SEARCH_TRANSLATION = {code: 0xF0000 + code for code in range(128)}
+# Pairs with the last character of a text, so one-character queries find it
+SEARCH_END = chr(0xF0000)
+
+def _search_text(text):
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split()).translate(SEARCH_TRANSLATION)
+
+def search_grams(text):
+    """Return text as the space-separated bigrams the search index stores
+
+    Text is NFKC-normalized, case-folded and whitespace-collapsed first.
+    """
+    text = _search_text(text)
+    return " ".join(map(str.__add__, text, text[1:] + SEARCH_END)) if text else ""
+
+def search_query(query):
+    """Return the FTS5 query for a search string: every whitespace-separated term as a substring"""
+    terms = []
+    for term in query.split():
+        term = _search_text(term)
+        terms.append(f'"{" ".join(map(str.__add__, term, term[1:]))}"' if len(term) > 1 else f'"{term}" *')
+    return " AND ".join(terms)
+
+def search_index_path(catalog_dir=CATALOG_DIR):
+    """Return where the search index of a catalog directory is kept"""
+    catalog_dir = os.path.abspath(catalog_dir)
+    name = f"{os.path.basename(catalog_dir)}-{data_hash(catalog_dir.encode('utf-8'))[:12]}.search.sqlite3"
+    return os.path.join(CACHE_DIR, name)
+
+class SearchIndex:
+    """Persistent bigram index over the SEARCH_FIELDS of a catalog
+
+        with SearchIndex(search_index_path()) as index:
+            index.update()
+            index.search("未処理注文")
+
+    update() re-reads only module files whose size, mtime and then content
+    hash changed, and re-indexes only the cases whose case_hash() changed.
+    The FTS table is contentless; each case's indexed text is kept
+    compressed in cases so that it can be deleted again.
+    """
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SEARCH_SCHEMA)
+        version = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version != (str(SEARCH_INDEX_VERSION),):
+            with self.db:
+                for table in ("files", "cases"):
+                    self.db.execute(f"DELETE FROM {table}")
+                self.db.execute("INSERT INTO grams (grams) VALUES ('delete-all')")
+                self.db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(SEARCH_INDEX_VERSION),))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _remove(self, rowid, fields):
+        values = json.loads(zlib.decompress(fields))
+        self.db.execute(
+            "INSERT INTO grams (grams, rowid, name, preconditions, steps, expected, notes) "
+            "VALUES ('delete', ?, ?, ?, ?, ?, ?)", (rowid, *map(search_grams, values)))
+        self.db.execute("DELETE FROM cases WHERE id = ?", (rowid,))
+
+    def _index_file(self, module, path):
+        """Re-index the cases of one module file; return (indexed, removed)"""
+        indexed = removed = 0
+        previous = {case_id: (rowid, case_digest) for rowid, case_id, case_digest in self.db.execute(
+            "SELECT id, case_id, hash FROM cases WHERE path = ?", (path,))}
+        next_id = self.db.execute("SELECT coalesce(max(id), 0) + 1 FROM cases").fetchone()[0]
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                test_case = json.loads(line)
+                case_id = test_case.get("Test Case ID", "")
+                case_digest = case_hash(test_case)
+                rowid, old_digest = previous.pop(case_id, (None, None))
+                if old_digest == case_digest:
+                    continue
+                # Replaces the same ID here or in another module's file
+                for row in self.db.execute("SELECT id, fields FROM cases WHERE case_id = ?", (case_id,)).fetchall():
+                    self._remove(*row)
+                values = [test_case.get(field, "") for field in SEARCH_FIELDS]
+                self.db.execute("INSERT INTO cases VALUES (?, ?, ?, ?, ?, ?)", (
+                    next_id, case_id, module, path, case_digest,
+                    zlib.compress(json.dumps(values, ensure_ascii=False).encode("utf-8"))))
+                self.db.execute(
+                    "INSERT INTO grams (rowid, name, preconditions, steps, expected, notes) VALUES (?, ?, ?, ?, ?, ?)",
+                    (next_id, *map(search_grams, values)))
+                next_id += 1
+                indexed += 1
+        for rowid, _ in previous.values():
+            self._remove(*self.db.execute("SELECT id, fields FROM cases WHERE id = ?", (rowid,)).fetchone())
+            removed += 1
+        return indexed, removed
+
+    def update(self, catalog_dir=CATALOG_DIR):
+        """Bring the index up to date with a catalog; return (cases indexed, cases removed)"""
+        indexed = removed = 0
+        files = {path: rest for path, *rest in self.db.execute("SELECT path, mtime_ns, size, hash FROM files")}
+        with self.db:
+            for module, path in catalog_modules(catalog_dir):
+                path = os.path.abspath(path)
+                stat = os.stat(path)
+                mtime_ns, size, digest = files.pop(path, (None, None, None))
+                if (mtime_ns, size) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                new_digest = file_hash(path)
+                if new_digest != digest:
+                    counts = self._index_file(module, path)
+                    indexed, removed = indexed + counts[0], removed + counts[1]
+                self.db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                (path, stat.st_mtime_ns, stat.st_size, new_digest))
+            # Files no longer in the catalog
+            for path in files:
+                for row in self.db.execute("SELECT id, fields FROM cases WHERE path = ?", (path,)).fetchall():
+                    self._remove(*row)
+                    removed += 1
+                self.db.execute("DELETE FROM files WHERE path = ?", (path,))
+        return indexed, removed
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Return [(score, Test Case ID, Module, Test Case Name)] best match first
+
+        Every whitespace-separated term of query must occur in one of the
+        SEARCH_FIELDS (case-insensitively, after NFKC). Scores are FTS5 bm25
+        with SEARCH_WEIGHTS: lower is better. bm25 cannot rank one-character
+        terms, which are prefixes of the bigrams, so a query of only those
+        is ranked by their occurrences in each field, weighted alike; that
+        reads every matching case.
+        """
+        match = search_query(query)
+        if not match:
+            return []
+        terms = [_search_text(term) for term in query.split()]
+        if all(len(term) == 1 for term in terms):
+            return self._search_characters(match, terms, limit)
+        rows = self.db.execute(
+            f"SELECT rank, case_id, module, fields FROM ("
+            f"SELECT rowid, bm25(grams, {', '.join(map(str, SEARCH_WEIGHTS))}) AS rank FROM grams "
+            f"WHERE grams MATCH ? ORDER BY rank LIMIT ?) JOIN cases ON cases.id = rowid ORDER BY rank, case_id",
+            (match, limit))
+        return [(score, case_id, module, json.loads(zlib.decompress(fields))[0])
+                for score, case_id, module, fields in rows]
+
+    def _search_characters(self, match, characters, limit):
+        matches = []
+        rows = self.db.execute(
+            "SELECT case_id, module, fields FROM grams JOIN cases ON cases.id = grams.rowid WHERE grams MATCH ?",
+            (match,))
+        for case_id, module, fields in rows:
+            values = json.loads(zlib.decompress(fields))
+            score = -sum(weight * _search_text(value).count(character)
+                         for value, weight in zip(values, SEARCH_WEIGHTS) for character in characters)
+            matches.append((score, case_id, module, values[0]))
+        matches.sort()
+        return matches[:limit]
+
+def search_test_cases(query, limit=SEARCH_LIMIT, catalog_dir=CATALOG_DIR):
+    """Update the catalog's search index and return the matches of query (see SearchIndex.search)"""
+    with SearchIndex(search_index_path(catalog_dir)) as index:
+        index.update(catalog_dir)
+        return index.search(query, limit)
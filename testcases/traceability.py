@@ -0,0 +1,273 @@
+"""
+Automation traceability
+Links catalog test cases to the Playwright specs under auto/tests
+"""
+
+import json
+import os
+import re
+import tempfile
+
+from .catalog import CACHE_DIR, PROJECT_DIR, TEST_CASE_ID_RE, data_hash, file_hash, iter_test_cases
+from .results import normalize_title
+
+# Playwright spec tree scanned for test titles and tags
+AUTO_TESTS_DIR = os.path.join(PROJECT_DIR, "auto", "tests")
+SPEC_SCAN_VERSION = 1
+
+# One pass over a spec file: comments and strings are skipped whole, braces
+# tracked for describe scopes, and test()/describe() calls with a literal
+# title picked up (test, authTest, test.describe.serial, test.skip, ...)
+SPEC_TOKEN_RE = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<call>\b(?P<function>[A-Za-z_$][\w$]*)
+        (?P<modifiers>(?:\.(?:describe|skip|only|fixme|fail|slow|serial|parallel))*)
+        \s*\(\s*(?P<quote>['"`])(?P<title>(?:\\.|(?!(?P=quote)).)*)(?P=quote))
+  | (?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)
+  | (?P<open>\{)
+  | (?P<close>\})
+""", re.DOTALL | re.VERBOSE)
+# { tag: '@UI-DASH-001' } or { tag: ['@smoke', '@UI-DASH-001'] } between a title and its callback
+SPEC_TAGS_RE = re.compile(r"""\s*,\s*\{[^{}]*?\btag\s*:\s*(\[[^\]]*\]|'[^']*'|"[^"]*")""")
+SPEC_TAG_RE = re.compile(r"""['"](@[^'"]+)['"]""")
+
+def _skip_space_back(source, end):
+    """Return the index just past the last non-whitespace character before end"""
+    while end and source[end - 1].isspace():
+        end -= 1
+    return end
+
+def _is_test_function(name):
+    return name in ("test", "it", "describe") or name.endswith("Test")
+
+def scan_spec_file(path):
+    """Return [{"titles", "tags", "line", "skipped"}] for the tests of one spec file
+
+    titles is the describe title path plus the test title, tags include the
+    enclosing describes' tags and skipped is set for test.skip/test.fixme
+    (or inside a skipped describe). A lexical scan, not a TypeScript parse:
+    only calls with a literal title are seen.
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tests = []
+    scopes = []  # (brace depth, title, tags, skipped) of the open describes
+    pending = None
+    depth = 0
+    line, counted = 1, 0  # line number at offset counted, advanced as tests are found
+    for match in SPEC_TOKEN_RE.finditer(source):
+        if match.group("open"):
+            depth += 1
+            # A describe's scope is the body of its callback; the text before
+            # the brace is looked at in place, not copied
+            if pending and source.endswith(("=>", ")"), 0, _skip_space_back(source, match.start())):
+                scopes.append((depth, *pending))
+                pending = None
+        elif match.group("close"):
+            if scopes and scopes[-1][0] == depth:
+                scopes.pop()
+            depth -= 1
+        elif match.group("call") and _is_test_function(match.group("function")):
+            modifiers = match.group("modifiers").split(".")
+            tags_match = SPEC_TAGS_RE.match(source, match.end())
+            tags = SPEC_TAG_RE.findall(tags_match.group(1)) if tags_match else []
+            skipped = "skip" in modifiers or "fixme" in modifiers or any(scope[3] for scope in scopes)
+            if "describe" in modifiers or match.group("function") == "describe":
+                pending = (match.group("title"), tags, skipped)
+            else:
+                line += source.count("\n", counted, match.start())
+                counted = match.start()
+                tests.append({
+                    "titles": [scope[1] for scope in scopes] + [match.group("title")],
+                    "tags": [tag for scope in scopes for tag in scope[2]] + tags,
+                    "line": line,
+                    "skipped": skipped
+                })
+    return tests
+
+def spec_scan_cache_path(root):
+    """Return where the scan of a spec tree is cached"""
+    root = os.path.abspath(root)
+    return os.path.join(CACHE_DIR, f"specs-{data_hash(root.encode('utf-8'))[:12]}.json")
+
+def scan_spec_tree(root=AUTO_TESTS_DIR, workers=None):
+    """Return {spec path relative to root: scan_spec_file() tests} for every *.spec.ts below root
+
+    Scans are cached per file under CACHE_DIR with the file's mtime, size
+    and content hash: an unchanged stat reuses the cached tests, a changed
+    stat with the same hash only refreshes it, and the remaining files are
+    scanned in parallel in up to workers processes.
+    """
+    cache_path = spec_scan_cache_path(root)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        cached = cached["files"] if cached.get("version") == SPEC_SCAN_VERSION else {}
+    except (OSError, ValueError):
+        cached = {}
+    
+    files = {}
+    changed = []
+    dirty = False
+    for directory, _, names in sorted(os.walk(root)):
+        for name in sorted(names):
+            if not name.endswith(".spec.ts"):
+                continue
+            path = os.path.join(directory, name)
+            relative = os.path.relpath(path, root).replace(os.sep, "/")
+            stat = os.stat(path)
+            entry = cached.get(relative)
+            if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+                files[relative] = entry
+                continue
+            dirty = True
+            digest = file_hash(path)
+            if entry and entry["hash"] == digest:
+                files[relative] = dict(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            else:
+                files[relative] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": digest}
+                changed.append((relative, path))
+    
+    workers = min(workers or os.cpu_count() or 1, len(changed))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            scans = list(executor.map(scan_spec_file, [path for _, path in changed]))
+    else:
+        scans = [scan_spec_file(path) for _, path in changed]
+    for (relative, _), tests in zip(changed, scans):
+        files[relative]["tests"] = tests
+    
+    if dirty or files.keys() != cached.keys():
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".json", dir=CACHE_DIR)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": SPEC_SCAN_VERSION, "files": files}, f, ensure_ascii=False)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    return {relative: entry["tests"] for relative, entry in files.items()}
+
+class Traceability:
+    """Links between catalog test cases and the Playwright tests automating them
+
+        trace = Traceability(scan_spec_tree())
+        cases = trace.collect(iter_test_cases())  # or trace.add() per case
+        ...
+        trace.coverage(), trace.links("UI-DASH-001")
+
+    A test automates every catalog ID in its titles or tags, or, when it
+    names no catalog ID, the case whose Test Case Name equals its title. Cases are counted as they stream past, so
+    only their IDs and candidate links are kept; the rule is finished once
+    all IDs are known. Skipped tests are linked but don't make a case
+    automated.
+    """
+
+    def __init__(self, specs):
+        self.tests = []
+        self.by_id = {}
+        self.by_title = {}
+        for spec, tests in specs.items():
+            for test in tests:
+                number = len(self.tests)
+                ids = set(TEST_CASE_ID_RE.findall(" ".join([*test["titles"], *test["tags"]])))
+                self.tests.append((spec, test, ids))
+                for case_id in ids:
+                    self.by_id.setdefault(case_id, []).append(number)
+                self.by_title.setdefault(normalize_title(test["titles"][-1]), []).append(number)
+        self.cases = {}
+
+    def add(self, test_case):
+        """Record one catalog test case and its candidate tests"""
+        case_id = test_case.get("Test Case ID", "")
+        self.cases[case_id] = (
+            test_case.get("Module", "Unknown"),
+            self.by_id.get(case_id, []),
+            self.by_title.get(normalize_title(test_case.get("Test Case Name", "")), [])
+        )
+
+    def collect(self, cases):
+        """Yield cases unchanged, recording each with add()"""
+        for test_case in cases:
+            self.add(test_case)
+            yield test_case
+
+    def links(self, case_id):
+        """Return [(spec path, test dict)] of the tests linked to one test case"""
+        _, by_id, by_title = self.cases.get(case_id, ("", [], []))
+        numbers = by_id or [number for number in by_title if not self.tests[number][2] & self.cases.keys()]
+        return [self.tests[number][:2] for number in numbers]
+
+    def is_automated(self, case_id):
+        return any(not test["skipped"] for _, test in self.links(case_id))
+
+    def coverage(self):
+        """Return {Module: (test cases, automated)}"""
+        counts = {}
+        for case_id, (module, _, _) in self.cases.items():
+            total, automated = counts.get(module, (0, 0))
+            counts[module] = (total + 1, automated + self.is_automated(case_id))
+        return dict(sorted(counts.items()))
+
+    def unlinked_tests(self):
+        """Return [(spec path, test dict)] of the tests linked to no catalog test case"""
+        linked = set()
+        for case_id in self.cases:
+            linked.update(id(test) for _, test in self.links(case_id))
+        return [(spec, test) for spec, test, _ in self.tests if id(test) not in linked]
+
+def build_traceability(cases=None, root=AUTO_TESTS_DIR, workers=None):
+    """Return the Traceability of cases (the catalog by default) against the spec tree under root"""
+    trace = Traceability(scan_spec_tree(root, workers))
+    for test_case in iter_test_cases() if cases is None else cases:
+        trace.add(test_case)
+    return trace
+
+def create_traceability_sheet(wb, trace):
+    """Create the Traceability sheet: automated vs manual-only test cases per Module, then every link
+
+    Rows are appended in order, as on the Summary sheet.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    
+    ws = wb.create_sheet("Traceability")
+    for column, width in zip("ABCDE", (25, 15, 50, 60, 12)):
+        ws.column_dimensions[column].width = width
+    
+    def trace_cell(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+    
+    ws.append([trace_cell("Automation Traceability", "Summary Title")])
+    ws.merged_cells.add('A1:D1')
+    ws.append([])
+    ws.append([trace_cell("Automation Coverage by Module", "Summary Section")])
+    ws.append([trace_cell(value, "Summary Header")
+               for value in ("Module", "Test Cases", "Automated", "Manual Only", "Automated %")])
+    coverage = trace.coverage()
+    coverage["Total"] = (sum(total for total, _ in coverage.values()),
+                         sum(automated for _, automated in coverage.values()))
+    for module, (total, automated) in coverage.items():
+        ws.append([module, total, automated, total - automated,
+                   trace_cell(automated / total if total else 0, "Summary Percent")])
+    
+    ws.append([])
+    ws.append([])
+    ws.append([trace_cell("Linked Playwright Tests", "Summary Section")])
+    ws.append([trace_cell(value, "Summary Header")
+               for value in ("Test Case ID", "Module", "Spec", "Test", "Skipped")])
+    for case_id, (module, _, _) in trace.cases.items():
+        for spec, test in trace.links(case_id):
+            ws.append([case_id, module, f"{spec}:{test['line']}", " > ".join(test["titles"]),
+                       "Yes" if test["skipped"] else ""])
+    
+    unlinked = trace.unlinked_tests()
+    ws.append([])
+    ws.append([])
+    ws.append([trace_cell(f"Playwright Tests Without a Test Case ({len(unlinked)})", "Summary Section")])
+    ws.append([trace_cell(value, "Summary Header") for value in ("Spec", "Test", "Skipped")])
+    for spec, test in unlinked:
+        ws.append([f"{spec}:{test['line']}", " > ".join(test["titles"]), "Yes" if test["skipped"] else ""])
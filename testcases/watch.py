@@ -0,0 +1,135 @@
+"""
+Watch mode
+Keeps the workbook in step with the catalog while it is being edited
+"""
+
+import json
+import os
+import sys
+import time
+
+from .catalog import CATALOG_DIR, SummaryCube, catalog_modules
+from .defaults import WATCH_DEBOUNCE, WATCH_INTERVAL
+from .incremental import RowBlocks, layout_hash, load_blocks, read_manifest, save_row_blocks
+
+class WorkbookWatcher:
+    """Keeps a workbook in step with the catalog, rebuilding only the modules that changed
+
+    Each module's rows are kept in memory as RowBlocks blocks, along with
+    the per-case hashes and Summary counts they were built from. A catalog
+    file whose size or mtime changed is read again and only the blocks whose
+    case hashes differ are rendered and compressed again; the workbook and
+    its manifest are then written by save_row_blocks(), as by an incremental
+    build. The first update starts from the blocks of the workbook already
+    there, so update_excel_file() and the watcher carry on from each other.
+    """
+
+    def __init__(self, filename="Partner Dashboard Test Cases.xlsx", catalog_dir=CATALOG_DIR, conditional=False,
+                 summary_formulas=False, compression=None):
+        self.filename = filename
+        self.catalog_dir = catalog_dir
+        self.conditional = conditional
+        self.summary_formulas = summary_formulas
+        self.compression = compression
+        self.rows = RowBlocks(conditional, compression)
+        self.modules = {}
+        self.written = False
+        # Blocks of the workbook found on disk, used until the first write
+        self.found = None
+
+    def signature(self):
+        """Return what a change to the catalog files changes: their paths, sizes and mtimes"""
+        try:
+            paths = [os.path.join(self.catalog_dir, "index.json")]
+            paths.extend(path for _, path in catalog_modules(self.catalog_dir))
+            signature = []
+            for path in paths:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            return signature
+        except (OSError, ValueError) as error:
+            # Caught mid-save; the next poll will see the finished file
+            return str(error)
+
+    def _module_state(self, module, path, stat, state):
+        # The stat is taken before reading, so a save racing the read shows
+        # up as another change on the next poll
+        with open(path, encoding="utf-8") as f:
+            cases = [json.loads(line) for line in f if line.strip()]
+        previous = {block[0]: block for block in state["blocks"]} if state is not None else self.found
+        hashes = []
+        blocks = self.rows.blocks(cases, previous, hashes)
+        if state is not None and state["module"] == module and state["hashes"] == hashes:
+            return dict(state, stat=stat), False
+        return {
+            "module": module,
+            "stat": stat,
+            "hashes": hashes,
+            "cells": SummaryCube(cases).cells,
+            "blocks": blocks
+        }, True
+
+    def update(self):
+        """Bring the workbook up to date with the catalog
+
+        Returns the modules whose test cases changed, or None when the
+        workbook was left alone.
+        """
+        if self.found is None:
+            layout = layout_hash(self.conditional, self.summary_formulas, self.compression)
+            self.found = load_blocks(self.filename, read_manifest(self.filename, layout))
+        states = {}
+        changed = []
+        for module, path in catalog_modules(self.catalog_dir):
+            stat = os.stat(path)
+            stat = (stat.st_mtime_ns, stat.st_size)
+            state = self.modules.get(path)
+            if state is None or state["module"] != module or state["stat"] != stat:
+                state, modified = self._module_state(module, path, stat, state)
+                if modified:
+                    changed.append(module)
+            states[path] = state
+        if self.written and not changed and list(states) == list(self.modules):
+            self.modules = states
+            return None
+        self._write(list(states.values()))
+        self.modules = states
+        self.written = True
+        return changed
+
+    def _write(self, states):
+        cube = SummaryCube()
+        for state in states:
+            cube.cells.update(state["cells"])
+        save_row_blocks(self.filename, [block for state in states for block in state["blocks"]],
+                        [case for state in states for case in state["hashes"]], cube, self.conditional,
+                        self.summary_formulas, self.compression)
+        self.found = {}
+
+    def watch(self, interval=WATCH_INTERVAL, debounce=WATCH_DEBOUNCE):
+        """Update the workbook after every burst of catalog changes, until interrupted
+
+        A change is acted on once the catalog files have stayed the same for
+        debounce seconds. When the update fails (a line saved half-way, the
+        workbook locked by Excel) the error is reported and the update
+        retried on the next change.
+        """
+        built = seen = None
+        changed_at = 0.0
+        while True:
+            current = self.signature()
+            now = time.monotonic()
+            if current != seen:
+                seen, changed_at = current, now
+            elif current != built and now - changed_at >= debounce:
+                built = current
+                first = not self.written
+                try:
+                    changed = self.update()
+                except (OSError, ValueError) as error:
+                    print(f"Could not update {self.filename}: {error}", file=sys.stderr)
+                else:
+                    if changed is not None:
+                        modules = "all modules" if first else ", ".join(changed) or "no test cases changed"
+                        print(f"Updated {self.filename} ({modules}) in {time.monotonic() - now:.2f} s", flush=True)
+            time.sleep(interval)
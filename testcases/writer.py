@@ -0,0 +1,523 @@
+"""
+Test Cases workbook writer
+Styles, the Test Cases and Summary sheets, and atomic saving with openpyxl
+"""
+
+# openpyxl is imported by the functions using it, so that catalog-only work
+# (counts, validation, exports) starts without it
+from datetime import datetime, timezone
+import html
+import io
+import os
+import re
+import tempfile
+import zipfile
+
+from .archive import replace_file, zip_compression
+from .catalog import HEADERS, PRIORITY_COLORS, STATUS_COLORS, SummaryCube, iter_test_cases
+
+# ==================== STYLES ====================
+COLUMN_WIDTHS = {
+    "A": 15,  # Test Case ID
+    "B": 20,  # Module
+    "C": 40,  # Test Case Name
+    "D": 12,  # Test Type
+    "E": 12,  # Priority
+    "F": 30,  # Preconditions
+    "G": 50,  # Test Steps
+    "H": 50,  # Expected Results
+    "I": 12,  # Status
+    "J": 40   # Notes
+}
+
+# Named cell styles: font, fill color, alignment and thin border per style
+STYLE_SPECS = {
+    "Test Case Header": {
+        "font": {"bold": True, "color": "FFFFFF"},
+        "fill": "366092",
+        "alignment": {"horizontal": "center", "vertical": "center", "wrap_text": True},
+        "border": True
+    },
+    "Test Case Body": {
+        "alignment": {"vertical": "top", "wrap_text": True},
+        "border": True
+    },
+    "Summary Title": {"font": {"bold": True, "size": 16}},
+    "Summary Section": {"font": {"bold": True, "size": 12}},
+    "Summary Header": {"font": {"bold": True}, "fill": "D3D3D3"},
+    "Summary Percent": {"number_format": "0.0%"}
+}
+
+# Test case cells whose style depends on their value, by column
+VALUE_COLORS = {"Priority": PRIORITY_COLORS, "Status": STATUS_COLORS}
+VALUE_STYLES = {
+    header: {value: f"{header} {value}" for value in colors}
+    for header, colors in VALUE_COLORS.items()
+}
+
+# Last row of an Excel sheet; conditional formats run down to it
+EXCEL_MAX_ROW = 1048576
+
+def register_styles(wb):
+    """Register the named styles for STYLE_SPECS and VALUE_STYLES on the workbook
+
+    Styles are built once per workbook; cells then reference them by name
+    instead of constructing their own Font/PatternFill/Border objects.
+    """
+    from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.styles.fonts import DEFAULT_FONT
+    
+    specs = dict(STYLE_SPECS)
+    for header, colors in VALUE_COLORS.items():
+        for value, (fill_color, white_font) in colors.items():
+            spec = dict(STYLE_SPECS["Test Case Body"], fill=fill_color)
+            if white_font:
+                spec["font"] = {"bold": True, "color": "FFFFFF"}
+            specs[VALUE_STYLES[header][value]] = spec
+    
+    thin = Side(style='thin')
+    for name, spec in specs.items():
+        style = NamedStyle(name=name, font=DEFAULT_FONT)
+        if "font" in spec:
+            style.font = Font(**spec["font"])
+        if "fill" in spec:
+            style.fill = PatternFill(start_color=spec["fill"], end_color=spec["fill"], fill_type="solid")
+        if "alignment" in spec:
+            style.alignment = Alignment(**spec["alignment"])
+        if spec.get("border"):
+            style.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        if "number_format" in spec:
+            style.number_format = spec["number_format"]
+        wb.add_named_style(style)
+
+def cell_style(header, value, conditional=False):
+    """Return the named style for a test case cell
+
+    With conditional, value colors come from add_value_rules() instead and
+    every cell gets the body style.
+    """
+    if conditional:
+        return "Test Case Body"
+    return VALUE_STYLES.get(header, {}).get(value, "Test Case Body")
+
+def add_value_rules(ws):
+    """Color the Priority and Status columns with conditional formatting
+
+    One range-level rule per value replaces the per-cell fills, so the
+    styles table stays small and a value a tester types in Excel gets its
+    color right away. Rules run from below the header to the last row of the
+    sheet, which also covers rows added by hand.
+    """
+    from openpyxl.formatting.rule import CellIsRule
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+    
+    for header, colors in VALUE_COLORS.items():
+        column = get_column_letter(HEADERS.index(header) + 1)
+        for value, (fill_color, white_font) in colors.items():
+            quoted = '"' + value.replace('"', '""') + '"'
+            ws.conditional_formatting.add(f"{column}2:{column}{EXCEL_MAX_ROW}", CellIsRule(
+                operator="equal",
+                formula=[quoted],
+                fill=PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid"),
+                font=Font(bold=True, color="FFFFFF") if white_font else None
+            ))
+
+# ==================== SHEETS ====================
+def write_test_cases(ws, cases, cube=None, conditional=False):
+    """Write header and test case rows into a regular worksheet
+
+    Each test case is also counted into cube, if given. With conditional
+    the Priority and Status colors are left to add_value_rules().
+    """
+    # Write headers
+    for col_num, header in enumerate(HEADERS, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.style = "Test Case Header"
+    
+    # Write test cases, color coded by priority and status
+    for row_num, test_case in enumerate(cases, 2):
+        if cube is not None:
+            cube.add(test_case)
+        for col_num, header in enumerate(HEADERS, 1):
+            value = test_case.get(header, "")
+            cell = ws.cell(row=row_num, column=col_num, value=value)
+            cell.style = cell_style(header, value, conditional)
+    
+    if conditional:
+        add_value_rules(ws)
+    
+    # Set column widths
+    for col, width in COLUMN_WIDTHS.items():
+        ws.column_dimensions[col].width = width
+    
+    # Freeze header row
+    ws.freeze_panes = "A2"
+
+def write_test_cases_streaming(ws, cases, cube=None, conditional=False):
+    """Stream header and test case rows into a write-only worksheet
+
+    Each test case is also counted into cube, if given. With conditional
+    the Priority and Status colors are left to add_value_rules().
+
+    One pre-styled cell per column and named style is built up front and
+    refilled for each row, since a write-only sheet serializes a row as soon
+    as it is appended.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    
+    # Layout must be set before the first row is written
+    for col, width in COLUMN_WIDTHS.items():
+        ws.column_dimensions[col].width = width
+    ws.freeze_panes = "A2"
+    if conditional:
+        add_value_rules(ws)
+    
+    def styled_cell(style, value=None):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+    
+    # Write headers
+    ws.append([styled_cell("Test Case Header", header) for header in HEADERS])
+    
+    body_cells = [styled_cell("Test Case Body") for _ in HEADERS]
+    value_cells = {
+        HEADERS.index(header): {value: styled_cell(style) for value, style in styles.items()}
+        for header, styles in VALUE_STYLES.items()
+        if not conditional
+    }
+    
+    # Write test cases
+    for test_case in cases:
+        if cube is not None:
+            cube.add(test_case)
+        row = []
+        for col_num, header in enumerate(HEADERS):
+            value = test_case.get(header, "")
+            cell = body_cells[col_num]
+            if col_num in value_cells:
+                cell = value_cells[col_num].get(value, cell)
+            cell.value = value
+            row.append(cell)
+        ws.append(row)
+
+def summary_range(header):
+    """Return the absolute whole-column range of a Test Cases column, for Summary formulas"""
+    from openpyxl.utils import get_column_letter
+    column = get_column_letter(HEADERS.index(header) + 1)
+    return f"'Test Cases'!${column}:${column}"
+
+def create_summary_sheet(wb, cube=None, formulas=False):
+    """Create summary sheet with statistics
+
+    All figures come from cube (built from the whole catalog when not
+    given). Rows are appended in order so the same code works for regular and
+    write-only workbooks. With formulas=True every count and pass rate is a
+    COUNTIF/COUNTIFS formula over the Test Cases sheet instead, so the Summary
+    follows Status edits made in Excel; the Priority and Status sections then
+    list every value, counted or not. The figures from cube are kept in
+    ws.cached_values and stored as the formulas' cached results when saved
+    (see WorkbookArchive). COUNTIF ignores case, so values differing only in
+    case share one count once Excel recalculates.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.utils import get_column_letter
+    
+    if cube is None:
+        cube = SummaryCube(iter_test_cases())
+    
+    ws = wb.create_sheet("Summary", 1)
+    
+    # Set column widths
+    ws.column_dimensions['A'].width = 25
+    ws.column_dimensions['B'].width = 15
+    for col in "CDEFG":
+        ws.column_dimensions[col].width = 12
+    
+    def summary_cell(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+    
+    cached_values = {}
+    row_number = 0
+    
+    def append(values):
+        # Figures are (formula, value, style): the formula may refer to the
+        # row being appended as {row}
+        nonlocal row_number
+        row_number += 1
+        row = []
+        for column, value in enumerate(values, 1):
+            if isinstance(value, tuple):
+                formula, value, style = value
+                if formulas:
+                    cached_values[f"{get_column_letter(column)}{row_number}"] = value
+                    value = "=" + formula.format(row=row_number)
+                if style is not None:
+                    value = summary_cell(value, style)
+            row.append(value)
+        ws.append(row)
+    
+    # Title
+    append([summary_cell("Partner Dashboard Test Cases - Summary", "Summary Title")])
+    ws.merged_cells.add('A1:D1')
+    
+    modules = cube.counts("Module")
+    priorities = cube.counts("Priority")
+    statuses = cube.counts("Status")
+    types = cube.counts("Test Type")
+    
+    sections = [
+        ("Test Cases by Module", "Module", sorted(modules.items())),
+        ("Test Cases by Priority", "Priority",
+         [(p, priorities.get(p, 0)) for p in PRIORITY_COLORS if formulas or p in priorities]),
+        ("Test Cases by Status", "Status",
+         [(s, statuses.get(s, 0)) for s in STATUS_COLORS if formulas or s in statuses]),
+        ("Test Cases by Type", "Test Type", sorted(types.items()))
+    ]
+    
+    for index, (title, label, counts) in enumerate(sections):
+        # One blank row after the title, two between sections
+        for _ in range(1 if index == 0 else 2):
+            append([])
+        append([summary_cell(title, "Summary Section")])
+        append([summary_cell(value, "Summary Header") for value in (label, "Count", None, None)])
+        for name, count in counts:
+            append([name, (f"COUNTIF({summary_range(label)},$A{{row}})", count, None)])
+    
+    def crosstab_header(title, dimension, values, extra=()):
+        # Returns the header row's number: the figures' formulas take the
+        # value they count from it
+        for _ in range(2):
+            append([])
+        append([summary_cell(title, "Summary Section")])
+        append([summary_cell(value, "Summary Header") for value in (dimension, "Total", *values, *extra)])
+        return row_number
+    
+    def crosstab_figures(dimension, across, values, header, counts):
+        rows, columns = summary_range(dimension), summary_range(across)
+        return [
+            (f"COUNTIF({rows},$A{{row}})", sum(counts.values()), None),
+            *((f"COUNTIFS({rows},$A{{row}},{columns},{get_column_letter(column)}${header})", counts.get(value, 0), None)
+              for column, value in enumerate(values, 3))
+        ]
+    
+    # Cross-tabs
+    status_by_module = cube.crosstab("Module", "Status")
+    pass_rates = cube.pass_rate("Module")
+    pass_column = get_column_letter(3 + list(STATUS_COLORS).index("Pass"))
+    
+    header = crosstab_header("Status by Module", "Module", STATUS_COLORS, ["Pass Rate"])
+    for module, counts in sorted(status_by_module.items()):
+        append([
+            module,
+            *crosstab_figures("Module", "Status", STATUS_COLORS, header, counts),
+            (f"IF($B{{row}}=0,0,{pass_column}{{row}}/$B{{row}})", pass_rates[module], "Summary Percent")
+        ])
+    
+    priority_by_type = cube.crosstab("Test Type", "Priority")
+    
+    header = crosstab_header("Priority Mix by Type", "Test Type", PRIORITY_COLORS)
+    for test_type, counts in sorted(priority_by_type.items()):
+        append([test_type, *crosstab_figures("Test Type", "Priority", PRIORITY_COLORS, header, counts)])
+    
+    if formulas:
+        ws.cached_values = cached_values
+
+# ==================== SAVING ====================
+# A formula cell as openpyxl writes it, with an empty value
+EMPTY_FORMULA_RE = re.compile(rb'<c r="([A-Z]+[0-9]+)"([^>]*)>(<f>[^<]*</f>)(?:<v ?/>|<v></v>)')
+
+def fill_cached_values(xml, values):
+    """Return worksheet XML with values ({coordinate: number}) as its formulas' cached results"""
+    def fill(match):
+        value = values.get(match.group(1).decode("ascii"))
+        if value is None:
+            return match.group(0)
+        return b'<c r="%s"%s>%s<v>%s</v>' % (match.group(1), match.group(2), match.group(3), str(value).encode("ascii"))
+    return EMPTY_FORMULA_RE.sub(fill, xml)
+
+class WorkbookArchive(zipfile.ZipFile):
+    """Zip archive for ExcelWriter that stores the cached results of formulas
+
+    openpyxl writes formulas without a value, so anything that does not
+    recalculate shows them empty. Worksheets of wb with a cached_values
+    attribute ({coordinate: number}, see create_summary_sheet) get those
+    filled in as they are written.
+    """
+
+    def __init__(self, file, wb, *args, **kwargs):
+        super().__init__(file, *args, **kwargs)
+        self.worksheets = [ws for ws in wb.worksheets if getattr(ws, "cached_values", None)]
+
+    def write(self, filename, arcname=None, *args, **kwargs):
+        # Worksheet part names are only settled once ExcelWriter numbers the sheets
+        values = next((ws.cached_values for ws in self.worksheets if ws.path[1:] == arcname), None)
+        if values is None:
+            return super().write(filename, arcname, *args, **kwargs)
+        with open(filename, "rb") as f:
+            self.writestr(arcname, fill_cached_values(f.read(), values))
+
+def save_workbook(wb, filename, compression=None, in_memory=False):
+    """Save a workbook to filename atomically, with a choice of zip compression
+
+    The zip is built in a temporary file next to filename (or, with
+    in_memory=True, in memory and then written out in one go) and renamed
+    over filename only once complete, so a crash mid-save leaves the
+    previous file intact instead of a corrupt one. compression is as for
+    zip_compression().
+    """
+    from openpyxl.writer.excel import ExcelWriter
+    
+    compress_type, level = zip_compression(compression)
+    if wb.write_only and not wb.worksheets:
+        wb.create_sheet()
+    wb.properties.modified = datetime.now(timezone.utc).replace(tzinfo=None)
+    fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            target = io.BytesIO() if in_memory else f
+            ExcelWriter(wb, WorkbookArchive(target, wb, "w", compress_type, allowZip64=True, compresslevel=level)).save()
+            if in_memory:
+                f.write(target.getbuffer())
+        replace_file(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+# ==================== ROW XML ====================
+def style_ids(wb):
+    """Return {named style: cell format index} for the styles registered on wb
+
+    Indexes are assigned in registration order, so they are the same for every
+    workbook built by register_styles(). A detached cell is given each style
+    in turn, which registers its format the way styling a real cell would.
+    """
+    from openpyxl.cell.cell import Cell
+    
+    cell = Cell(wb.worksheets[0])
+    ids = {}
+    for name in wb.named_styles:
+        cell.style = name
+        ids[name] = cell.style_id
+    return ids
+
+def row_xml_renderer(ids, conditional=False):
+    """Return a function serializing one test case as a <row> element
+
+    Cells hold inline strings and carry no row or cell references, so a
+    rendered row does not depend on its position and later builds can reuse
+    it as-is. With conditional every cell gets the body style.
+    """
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    from openpyxl.utils.exceptions import IllegalCharacterError
+    
+    columns = [
+        (header, ids["Test Case Body"],
+         {} if conditional else {value: ids[name] for value, name in VALUE_STYLES.get(header, {}).items()})
+        for header in HEADERS
+    ]
+    
+    def render(test_case):
+        cells = []
+        for header, default_style, value_styles in columns:
+            value = test_case.get(header, "")
+            style = value_styles.get(value, default_style)
+            if value is None or value == "":
+                cells.append(f'<c s="{style}"/>')
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f'<c s="{style}"><v>{value}</v></c>')
+            else:
+                text = str(value)
+                if ILLEGAL_CHARACTERS_RE.search(text):
+                    raise IllegalCharacterError(f"{text!r} cannot be used in worksheets.")
+                space = ' xml:space="preserve"' if text != text.strip() else ""
+                cells.append(f'<c s="{style}" t="inlineStr"><is><t{space}>{html.escape(text, quote=False)}</t></is></c>')
+        return ("<row>" + "".join(cells) + "</row>").encode("utf-8")
+    
+    return render
+
+def new_skeleton(conditional=False):
+    """Return a workbook with the named styles and an empty Test Cases sheet
+
+    Row XML is spliced into the saved skeleton by write_workbook_parts().
+    """
+    import openpyxl
+    
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    register_styles(wb)
+    write_test_cases(wb.create_sheet("Test Cases", 0), [], conditional=conditional)
+    return wb
+
+def save_skeleton(wb, timestamp=None):
+    """Serialize a skeleton workbook to bytes
+
+    With a timestamp the document properties are pinned to it instead of
+    the current time, so the output only depends on its content.
+    """
+    from openpyxl.writer.excel import ExcelWriter
+    
+    buffer = io.BytesIO()
+    if timestamp is None:
+        wb.properties.modified = datetime.now(timezone.utc).replace(tzinfo=None)
+    else:
+        wb.properties.created = wb.properties.modified = timestamp
+    ExcelWriter(wb, WorkbookArchive(buffer, wb, "w", zipfile.ZIP_DEFLATED, allowZip64=True)).save()
+    return buffer.getvalue()
+
+def split_sheet_xml(xml, count):
+    """Return the XML of an empty worksheet part before and after its rows, dimensioned for count rows"""
+    from openpyxl.utils import get_column_letter
+    
+    head, tail = xml.split(b"</sheetData>")
+    dimension = f'<dimension ref="A1:{get_column_letter(len(HEADERS))}{count + 1}" />'
+    head = re.sub(rb"<dimension [^>]*>", dimension.encode("utf-8"), head, count=1)
+    return head, b"</sheetData>" + tail
+
+# The ZipInfo attribute holding the compression level: public from Python 3.13
+ZIPINFO_LEVEL = "compress_level" if hasattr(zipfile.ZipInfo, "compress_level") else "_compresslevel"
+
+def write_workbook_parts(skeleton, parts, filename, timestamp=None, compression=None):
+    """Write the skeleton workbook to filename with rows spliced into its sheets
+
+    parts maps a worksheet part name to (row count, iterable of row XML
+    chunks). Parts are written in the order given, after the skeleton's other
+    members, so their chunks may be produced lazily. The file is built next
+    to filename and renamed into place, so readers never see a partial file.
+    With a timestamp every zip member carries it instead of the current time.
+    compression is as for zip_compression().
+    """
+    compress_type, level = zip_compression(compression)
+    fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(os.path.abspath(filename)))
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(io.BytesIO(skeleton)) as zin, \
+                zipfile.ZipFile(temp_path, "w", compress_type, allowZip64=True, compresslevel=level) as zout:
+            infos = {info.filename: info for info in zin.infolist()}
+            for name, info in infos.items():
+                if name not in parts:
+                    date_time = info.date_time if timestamp is None else timestamp.timetuple()[:6]
+                    info = zipfile.ZipInfo(name, date_time)
+                    info.compress_type = compress_type
+                    zout.writestr(info, zin.read(name), compresslevel=level)
+            for name, (count, chunks) in parts.items():
+                head, tail = split_sheet_xml(zin.read(name), count)
+                date_time = infos[name].date_time if timestamp is None else timestamp.timetuple()[:6]
+                info = zipfile.ZipInfo(name, date_time)
+                info.compress_type = compress_type
+                # zipfile only takes a level from the ZipInfo of a streamed member
+                setattr(info, ZIPINFO_LEVEL, level)
+                with zout.open(info, "w", force_zip64=True) as part:
+                    part.write(head)
+                    for chunk in chunks:
+                        part.write(chunk)
+                    part.write(tail)
+        replace_file(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
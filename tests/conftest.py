@@ -0,0 +1,26 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from testcases.catalog import CATALOG_DIR
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    """A copy of the catalog that a test may edit"""
+    return str(shutil.copytree(CATALOG_DIR, tmp_path / "catalog"))
+
+@pytest.fixture
+def edit_catalog_line(catalog_dir):
+    """edit_catalog_line(file, line number, edit) rewrites one test case of catalog_dir through edit(record)"""
+    def edit_line(file, line_number, edit):
+        path = os.path.join(catalog_dir, file)
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()
+        record = json.loads(lines[line_number - 1])
+        edit(record)
+        lines[line_number - 1] = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+    return edit_line
@@ -0,0 +1,68 @@
+import os
+import zipfile
+import zlib
+
+import pytest
+
+from testcases.archive import DEFLATE_END, crc32_combine, deflate_segment, replace_file, write_zip
+from testcases.catalog import iter_test_cases
+from testcases.watch import WorkbookWatcher
+
+@pytest.mark.parametrize("first, second", [
+    (b"", b""), (b"abc", b""), (b"", b"abc"), (b"Test Cases", b"\x00" * 1000), (os.urandom(77), os.urandom(4099))
+])
+def test_crc32_combine(first, second):
+    assert crc32_combine(zlib.crc32(first), zlib.crc32(second), len(second)) == zlib.crc32(first + second)
+
+def test_segments_join_into_one_member(tmp_path):
+    parts = [b"<row>" + bytes(range(256)) * n + b"</row>" for n in (0, 1, 40)]
+    crc, size = 0, 0
+    for part in parts:
+        crc, size = crc32_combine(crc, zlib.crc32(part), len(part)), size + len(part)
+    path = str(tmp_path / "parts.zip")
+    offsets = write_zip(path, [("single.xml", zlib.crc32(b"x"), 1, [deflate_segment(b"x"), DEFLATE_END]),
+                               ("joined.xml", crc, size, [*map(deflate_segment, parts), DEFLATE_END])])
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+        assert zf.read("joined.xml") == b"".join(parts)
+    with open(path, "rb") as f:
+        f.seek(offsets["single.xml"])
+        assert f.read(len(deflate_segment(b"x"))) == deflate_segment(b"x")
+
+def test_watcher_workbook_after_single_case_edit(edit_catalog_line, catalog_dir, tmp_path):
+    workbook = str(tmp_path / "cases.xlsx")
+    watcher = WorkbookWatcher(workbook, catalog_dir)
+    watcher.update()
+    
+    def edit(record):
+        record["Status"] = "Fail"
+    edit_catalog_line("dashboard.jsonl", 1, edit)
+    watcher.update()
+    with zipfile.ZipFile(workbook) as zf:
+        assert zf.testzip() is None
+    
+    import openpyxl
+    sheet = openpyxl.load_workbook(workbook)["Test Cases"]
+    assert sheet.max_row == len(list(iter_test_cases(catalog_dir=catalog_dir))) + 1
+    assert [cell.value for cell in sheet[2]][:2] == ["UI-DASH-001", "Dashboard"]
+
+def test_write_zip_refuses_zip64(tmp_path):
+    path = tmp_path / "big.zip"
+    with pytest.raises(ValueError, match="ZIP64"):
+        write_zip(str(path), [("big.xml", 0, 0x100000000, [b""])])
+    with pytest.raises(ValueError, match="ZIP64"):
+        write_zip(str(path), [(f"{index}.xml", 0, 0, [b""]) for index in range(0x10000)])
+    assert not path.exists()
+    assert os.listdir(tmp_path) == []
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_replace_file_keeps_the_target_mode(tmp_path):
+    target = tmp_path / "cases.xlsx"
+    target.write_bytes(b"old")
+    target.chmod(0o640)
+    temp = tmp_path / "cases.tmp"
+    temp.write_bytes(b"new")
+    temp.chmod(0o600)
+    replace_file(str(temp), str(target))
+    assert target.read_bytes() == b"new"
+    assert target.stat().st_mode & 0o777 == 0o640
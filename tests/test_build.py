@@ -0,0 +1,47 @@
+import zipfile
+import zlib
+
+import pytest
+
+from testcases.build import BuildOptions, create_excel_file
+from testcases.catalog import HEADERS, iter_test_cases
+from testcases.writer import cell_style
+
+@pytest.mark.parametrize("settings, problem", [
+    ({"mode": "sharded", "history": True}, "sharded builds do not support history"),
+    ({"mode": "incremental", "traceability": True}, "incremental builds do not support traceability"),
+    ({"mode": "export", "exports": {"csv": "cases.csv"}, "compression": 9}, "export builds do not support"),
+    ({"mode": "export"}, "export builds need exports"),
+    ({"trend_runs": 5}, "trend_runs needs history"),
+    ({"workers": 2}, "workers only apply to sharded builds"),
+    ({"compression": 12}, "compression must be"),
+    ({"mode": "fast"}, "Unknown build mode"),
+])
+def test_options_that_cannot_be_honored_are_rejected(settings, problem):
+    with pytest.raises(ValueError, match=problem):
+        BuildOptions(**settings)
+
+def test_export_build_writes_no_workbook(catalog_dir, tmp_path):
+    path = tmp_path / "cases.jsonl"
+    options = BuildOptions("export", exports={"jsonl": str(path)})
+    assert create_excel_file(str(path), iter_test_cases(catalog_dir=catalog_dir), options) is None
+    assert len(path.read_text(encoding="utf-8").splitlines()) == len(list(iter_test_cases(catalog_dir=catalog_dir)))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["cases.jsonl", "catalog"]
+
+def test_options_and_settings_are_exclusive():
+    with pytest.raises(TypeError):
+        create_excel_file("cases.xlsx", options=BuildOptions(), mode="streaming")
+
+def test_sharded_rows_carry_their_styles_and_level(catalog_dir, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = str(tmp_path / "cases.xlsx")
+    cases = list(iter_test_cases(catalog_dir=catalog_dir))
+    create_excel_file(path, iter(cases), mode="sharded", workers=1, compression=1)
+    
+    ws = openpyxl.load_workbook(path)["Test Cases"]
+    for test_case, row in zip(cases, ws.iter_rows(min_row=2)):
+        assert [cell.style for cell in row] == [cell_style(header, test_case.get(header, "")) for header in HEADERS]
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo("xl/worksheets/sheet1.xml")
+        compressor = zlib.compressobj(1, zlib.DEFLATED, -15)
+        assert info.compress_size == len(compressor.compress(zf.read(info)) + compressor.flush())
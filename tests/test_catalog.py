@@ -0,0 +1,19 @@
+import pytest
+
+import create_test_cases_excel
+from testcases.catalog import CatalogError, load_test_cases
+
+def rename_notes(record):
+    record["Note"] = record.pop("Notes")
+
+def test_unknown_field_names_its_file_and_line(edit_catalog_line, catalog_dir):
+    edit_catalog_line("dashboard.jsonl", 3, rename_notes)
+    with pytest.raises(CatalogError, match=r"dashboard\.jsonl:3: 'Note' is not a test case field"):
+        load_test_cases(catalog_dir=catalog_dir)
+
+def test_count_points_to_validate(edit_catalog_line, catalog_dir, capsys):
+    edit_catalog_line("dashboard.jsonl", 3, rename_notes)
+    assert create_test_cases_excel.main(["count", "--catalog", catalog_dir]) == 1
+    error = capsys.readouterr().err
+    assert "dashboard.jsonl:3: 'Note' is not a test case field" in error
+    assert "validate" in error
@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+
+import create_test_cases_excel
+from testcases.catalog import PROJECT_DIR, iter_test_cases
+from testcases.generate import generate_test_cases
+
+def test_import_leaves_build_modules_unloaded():
+    heavy = {"testcases.build", "testcases.watch", "openpyxl", "sqlite3", "cProfile"}
+    code = f"import sys, create_test_cases_excel; print(sorted({heavy!r} & set(sys.modules)))"
+    loaded = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    assert loaded.stdout.strip() == "[]"
+
+def test_profile_times_validation_and_imports(catalog_dir, tmp_path):
+    output = tmp_path / "cases.xlsx"
+    assert create_test_cases_excel.main(["--catalog", catalog_dir, "-o", str(output), "--profile", "timings"]) == 0
+    with open(tmp_path / "cases.timings.json", encoding="utf-8") as f:
+        phases = json.load(f)["phases"]
+    assert {"validate", "import", "setup", "read", "rows", "summary", "save"} <= set(phases)
+
+def test_build_reports_catalog_problems(edit_catalog_line, catalog_dir, tmp_path, capsys):
+    edit_catalog_line("dashboard.jsonl", 3, lambda record: record.update(Priority="Urgent"))
+    assert create_test_cases_excel.main(["--catalog", catalog_dir, "-o", str(tmp_path / "cases.xlsx")]) == 1
+    assert "dashboard.jsonl:3" in capsys.readouterr().err
+    assert not (tmp_path / "cases.xlsx").exists()
+
+def test_generated_cases_join_the_build(catalog_dir, capsys):
+    catalog = sum(1 for _ in iter_test_cases(catalog_dir=catalog_dir))
+    generated = sum(1 for _ in generate_test_cases())
+    assert create_test_cases_excel.main(["--catalog", catalog_dir, "--generated", "--dry-run"]) == 0
+    assert f"Would write {catalog + generated} test cases" in capsys.readouterr().out
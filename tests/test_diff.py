@@ -0,0 +1,40 @@
+from testcases import reader
+from testcases.build import create_excel_file
+from testcases.catalog import iter_test_cases
+from testcases.diff import WorkbookDiff
+from testcases.fields import FIELD_DEFINITIONS
+from testcases.reader import iter_workbook_values, sheet_part_size
+
+def edited_cases(catalog_dir):
+    """The catalog with one test case changed, one removed and one added"""
+    cases = [dict(case) for case in iter_test_cases(catalog_dir=catalog_dir)]
+    cases[3]["Status"] = "Fail" if cases[3]["Status"] != "Fail" else "Pass"
+    cases[3]["Notes"] += " (rerun)"
+    removed = cases.pop(10)
+    cases.insert(5, {**removed, "Test Case ID": removed["Test Case ID"] + "9"})
+    return cases
+
+def test_partitioned_diff_matches_in_memory_diff(catalog_dir, tmp_path):
+    old, new = str(tmp_path / "old.xlsx"), str(tmp_path / "new.xlsx")
+    create_excel_file(old, cases=iter_test_cases(catalog_dir=catalog_dir))
+    create_excel_file(new, cases=edited_cases(catalog_dir))
+    
+    in_memory = WorkbookDiff(old, new)
+    partition_bytes = sheet_part_size(old, "Test Cases") // 7
+    partitioned = WorkbookDiff(old, new, partition_bytes=partition_bytes)
+    changes = list(in_memory)
+    assert [kind for kind, _, _ in changes].count("changed") == 1
+    assert list(partitioned) == changes
+    for diff in (in_memory, partitioned):
+        assert (diff.added, diff.removed, diff.changed) == (1, 1, 1)
+    assert partitioned.field_changes == in_memory.field_changes
+    assert partitioned.summary_delta() == in_memory.summary_delta()
+
+def read_all_sheets(path):
+    return [(title, list(rows)) for title, rows in iter_workbook_values(path)]
+
+def test_spilled_shared_strings_read_the_same(monkeypatch):
+    in_memory = read_all_sheets(FIELD_DEFINITIONS)
+    monkeypatch.setattr(reader, "SHARED_STRINGS_SPILL_BYTES", 0)
+    assert read_all_sheets(FIELD_DEFINITIONS) == in_memory
+    assert any(value for _, rows in in_memory for row in rows for value in row)
@@ -0,0 +1,61 @@
+import csv
+import importlib.util
+import json
+import os
+
+import pytest
+
+import create_test_cases_excel
+from testcases.build import create_excel_file
+from testcases.catalog import HEADERS, iter_test_cases
+from testcases import exports as exporters
+from testcases.exports import export_test_cases
+
+def test_exports_match_the_catalog(catalog_dir, tmp_path):
+    exports = {"csv": str(tmp_path / "cases.csv"), "jsonl": str(tmp_path / "cases.jsonl")}
+    cases = list(iter_test_cases(catalog_dir=catalog_dir))
+    assert export_test_cases(exports, iter(cases)) == len(cases)
+    expected = [{header: str(case.get(header, "")) for header in HEADERS} for case in cases]
+    with open(exports["csv"], encoding="utf-8-sig", newline="") as f:
+        assert list(csv.DictReader(f)) == expected
+    with open(exports["jsonl"], encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [{header: case.get(header, "") for header in HEADERS}
+                                                    for case in cases]
+    assert sorted(os.listdir(tmp_path)) == ["cases.csv", "cases.jsonl", "catalog"]
+
+def test_parquet_export(catalog_dir, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "cases.parquet")
+    cases = list(iter_test_cases(catalog_dir=catalog_dir))
+    export_test_cases({"parquet": path}, iter(cases))
+    table = parquet.read_table(path)
+    assert table.column_names == list(HEADERS)
+    assert table.to_pylist() == [{header: str(case.get(header, "")) for header in HEADERS} for case in cases]
+
+def test_failed_export_leaves_no_files(catalog_dir, tmp_path):
+    csv_path = tmp_path / "cases.csv"
+    csv_path.write_text("previous export")
+    exports = {"csv": str(csv_path), "jsonl": str(tmp_path / "missing" / "cases.jsonl")}
+    with pytest.raises(OSError):
+        export_test_cases(exports, iter_test_cases(catalog_dir=catalog_dir))
+    assert csv_path.read_text() == "previous export"
+    assert sorted(os.listdir(tmp_path)) == ["cases.csv", "catalog"]
+
+def test_writer_that_fails_to_open_leaves_no_files(tmp_path):
+    with pytest.raises(LookupError):
+        exporters._CsvExporter(str(tmp_path / "cases.csv"), "no-such-encoding")
+    assert os.listdir(tmp_path) == []
+
+@pytest.mark.skipif(importlib.util.find_spec("pyarrow") is not None, reason="pyarrow is installed")
+def test_parquet_without_pyarrow_is_reported(catalog_dir, tmp_path, capsys):
+    output = str(tmp_path / "cases.parquet")
+    assert create_test_cases_excel.main(["--catalog", catalog_dir, "--format", "parquet", "-o", output]) == 1
+    assert "requires pyarrow" in capsys.readouterr().err
+    assert sorted(os.listdir(tmp_path)) == ["catalog"]
+
+def test_failed_build_leaves_no_exports(catalog_dir, tmp_path):
+    exports = {"jsonl": str(tmp_path / "cases.jsonl")}
+    with pytest.raises(OSError):
+        create_excel_file(str(tmp_path / "missing" / "cases.xlsx"), cases=iter_test_cases(catalog_dir=catalog_dir),
+                          exports=exports)
+    assert sorted(os.listdir(tmp_path)) == ["catalog"]
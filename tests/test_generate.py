@@ -0,0 +1,22 @@
+from testcases.generate import GENERATED_SCREENS, generate_test_cases
+
+SCREEN = GENERATED_SCREENS[0]
+
+def field(name, field_type, length=None, required=None):
+    return {"field": name, "type": field_type, "length": length, "required": required, "values": []}
+
+def invalid_case_ids(constraints):
+    return {case["Test Case Name"]: case["Test Case ID"]
+            for case in generate_test_cases([SCREEN], fields={SCREEN: constraints})
+            if "rejects" in case["Test Case Name"]}
+
+def test_ids_survive_added_and_reordered_fields():
+    fields = [field("Email", "email", required=True), field("Amount", "amount"), field("Name", "text", 20)]
+    before = invalid_case_ids(fields)
+    after = invalid_case_ids([field("Phone", "phone", required=True), *reversed(fields)])
+    assert len(after) > len(before)
+    assert {name: after[name] for name in before} == before
+
+def test_ids_are_unique():
+    cases = list(generate_test_cases())
+    assert len({case["Test Case ID"] for case in cases}) == len(cases)
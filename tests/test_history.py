@@ -0,0 +1,73 @@
+import pytest
+
+from testcases import build
+from testcases.build import create_excel_file
+from testcases.catalog import SummaryCube, iter_test_cases
+from testcases.defaults import TREND_RUNS
+from testcases.history import ResultHistory
+
+def run_cases(module, statuses):
+    return [{"Test Case ID": f"UI-{module[:4].upper()}-{number:03d}", "Module": module, "Status": status}
+            for number, status in enumerate(statuses, 1)]
+
+def record(store, cases, **options):
+    return store.record_run(SummaryCube(cases), [(case["Test Case ID"], case["Module"], case["Status"])
+                                                  for case in cases], **options)
+
+def test_partial_runs_stay_out_of_the_trend(tmp_path):
+    with ResultHistory(str(tmp_path / "history.sqlite3")) as store:
+        full = record(store, run_cases("Dashboard", ["Pass", "Fail"]) + run_cases("Search", ["Pass"]))
+        record(store, run_cases("Search", ["Fail"]), partial=True)
+        recent, rates = store.pass_rates()
+        _, overall = store.pass_rates(by_module=False)
+        assert [run_id for run_id, _ in recent] == [full]
+        assert rates == {"Dashboard": [0.5], "Search": [1.0]}
+        assert overall == {"All Modules": [pytest.approx(2 / 3)]}
+        assert store.latest_statuses()["UI-SEAR-001"] == "Fail"
+
+def test_uncommitted_run_is_dropped_on_close(tmp_path):
+    path = str(tmp_path / "history.sqlite3")
+    with ResultHistory(path) as store:
+        record(store, run_cases("Dashboard", ["Pass"]), commit=False)
+        assert len(store.runs()) == 1
+    with ResultHistory(path) as store:
+        assert store.runs() == []
+
+def test_run_is_recorded_once_the_workbook_is_saved(tmp_path, monkeypatch):
+    workbook = str(tmp_path / "cases.xlsx")
+    history = str(tmp_path / "history.sqlite3")
+    
+    def failing_save(*args):
+        raise OSError("disk full")
+    with monkeypatch.context() as patch:
+        patch.setattr(build, "save_workbook", failing_save)
+        with pytest.raises(OSError):
+            create_excel_file(workbook, history=history)
+    with ResultHistory(history) as store:
+        assert store.runs() == []
+    
+    create_excel_file(workbook, history=history)
+    with ResultHistory(history) as store:
+        assert len(store.runs()) == 1
+
+def test_builds_over_given_cases_are_partial(catalog_dir, tmp_path):
+    workbook = str(tmp_path / "cases.xlsx")
+    history = str(tmp_path / "history.sqlite3")
+    create_excel_file(workbook, cases=iter_test_cases(["Dashboard"], catalog_dir=catalog_dir), history=history)
+    with ResultHistory(history) as store:
+        assert store.runs() == []
+        assert store.db.execute("SELECT count(*) FROM runs WHERE partial").fetchone() == (1,)
+
+def test_last_statuses_come_from_the_last_runs(tmp_path):
+    with ResultHistory(str(tmp_path / "history.sqlite3")) as store:
+        record(store, run_cases("Dashboard", ["Fail", "Pass"]))
+        for _ in range(3 * TREND_RUNS):
+            record(store, run_cases("Dashboard", ["Pass", "Pass"]))
+        assert store.latest_statuses(4 * TREND_RUNS) == {"UI-DASH-001": "Pass", "UI-DASH-002": "Pass"}
+        # Statuses unchanged for TREND_RUNS runs are recorded again, so the last runs always hold every case
+        assert store.latest_statuses().keys() == {"UI-DASH-001", "UI-DASH-002"}
+        assert [status for _, status in store.case_history("UI-DASH-001")] == ["Fail", "Pass"]
+        assert [status for _, status in store.case_history("UI-DASH-002")] == ["Pass"]
+        plan = " ".join(row[-1] for row in store.db.execute(
+            "EXPLAIN QUERY PLAN SELECT case_id, status FROM status_changes WHERE run_id >= 1 ORDER BY run_id"))
+        assert "status_changes_by_run" in plan
@@ -0,0 +1,66 @@
+import zipfile
+
+import pytest
+
+from testcases import incremental
+from testcases.catalog import HEADERS, iter_test_cases
+from testcases.incremental import update_excel_file
+from testcases.reader import read_workbook
+from testcases.watch import WorkbookWatcher
+
+BLOCK_ROWS = incremental.BLOCK_ROWS
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    # Many blocks even for the small catalog
+    monkeypatch.setattr(incremental, "BLOCK_ROWS", 8)
+
+def workbook_matches_catalog(workbook, catalog_dir):
+    with zipfile.ZipFile(workbook) as zf:
+        assert zf.testzip() is None
+    expected = {case["Test Case ID"]: {header: str(case.get(header, "")) for header in HEADERS}
+                for case in iter_test_cases(catalog_dir=catalog_dir)}
+    records = {case_id: {header: str(value) for header, value in record.items()}
+               for case_id, record in read_workbook(workbook).items()}
+    return records == expected
+
+def add_note(record):
+    record["Notes"] += " (edited)"
+
+def test_update_renders_only_the_changed_block(edit_catalog_line, catalog_dir, tmp_path, capsys):
+    workbook = str(tmp_path / "cases.xlsx")
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    assert "up to date" in capsys.readouterr().out
+    
+    edit_catalog_line("dashboard.jsonl", 2, add_note)
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    rendered = int(capsys.readouterr().out.split("(")[1].split()[0])
+    assert 0 < rendered <= 4 * incremental.BLOCK_ROWS
+    assert workbook_matches_catalog(workbook, catalog_dir)
+
+def test_one_row_edit_renders_only_its_module(edit_catalog_line, catalog_dir, tmp_path, capsys, monkeypatch):
+    monkeypatch.setattr(incremental, "BLOCK_ROWS", BLOCK_ROWS)
+    workbook = str(tmp_path / "cases.xlsx")
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    capsys.readouterr()
+    
+    edit_catalog_line("order_management.jsonl", 5, add_note)
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    module_cases = list(iter_test_cases(["Order Management"], catalog_dir=catalog_dir))
+    assert f"({len(module_cases)} rows rendered" in capsys.readouterr().out
+    assert workbook_matches_catalog(workbook, catalog_dir)
+
+def test_watcher_and_incremental_build_share_blocks(edit_catalog_line, catalog_dir, tmp_path, capsys):
+    workbook = str(tmp_path / "cases.xlsx")
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    watcher = WorkbookWatcher(workbook, catalog_dir)
+    watcher.update()
+    assert watcher.rows.rendered == 0
+    
+    edit_catalog_line("dashboard.jsonl", 2, add_note)
+    assert watcher.update() == ["Dashboard"]
+    assert workbook_matches_catalog(workbook, catalog_dir)
+    capsys.readouterr()
+    update_excel_file(workbook, iter_test_cases(catalog_dir=catalog_dir))
+    assert "up to date" in capsys.readouterr().out
@@ -0,0 +1,96 @@
+import json
+
+from testcases.build import create_excel_file
+from testcases.catalog import iter_test_cases, validate_catalog
+from testcases.results import (PLAYWRIGHT_NOTE, _JsonReader, ingest_playwright_results, merge_workbook_results,
+                               summarize_runs)
+
+def write_report(path, case_id, status):
+    spec = {"title": f"{case_id} check", "id": case_id, "tests": [
+        {"projectName": "chromium", "status": status, "results": [{}]}
+    ]}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"suites": [{"title": "dashboard.spec.ts", "specs": [spec]}]}, f)
+
+def catalog_case(catalog_dir, case_id):
+    return next(case for case in iter_test_cases(catalog_dir=catalog_dir) if case["Test Case ID"] == case_id)
+
+def test_merged_run_summary_is_replaced_by_the_next_run(catalog_dir, tmp_path):
+    workbook = str(tmp_path / "cases.xlsx")
+    report = str(tmp_path / "results.json")
+    notes = catalog_case(catalog_dir, "UI-DASH-001")["Notes"]
+    for status in ("unexpected", "expected", "expected"):
+        write_report(report, "UI-DASH-001", status)
+        create_excel_file(workbook, cases=iter_test_cases(catalog_dir=catalog_dir), results=report)
+        merge_workbook_results(workbook, catalog_dir=catalog_dir)
+    merged = catalog_case(catalog_dir, "UI-DASH-001")
+    assert merged["Status"] == "Pass"
+    run_lines = [line for line in merged["Notes"].splitlines() if line.startswith(PLAYWRIGHT_NOTE)]
+    assert run_lines == [PLAYWRIGHT_NOTE + "passed on chromium"]
+    assert merged["Notes"] == (f"{notes}\n" if notes else "") + run_lines[0]
+
+def test_merge_skips_edits_that_fail_validation(catalog_dir, tmp_path, capsys):
+    import openpyxl
+    
+    workbook = str(tmp_path / "cases.xlsx")
+    create_excel_file(workbook, cases=iter_test_cases(catalog_dir=catalog_dir))
+    book = openpyxl.load_workbook(workbook)
+    sheet = book["Test Cases"]
+    headers = [cell.value for cell in sheet[1]]
+    rows = {row[headers.index("Test Case ID")].value: row for row in sheet.iter_rows(min_row=2)}
+    rows["UI-DASH-001"][headers.index("Status")].value = "Passed"
+    rows["UI-DASH-002"][headers.index("Status")].value = "Fail"
+    book.save(workbook)
+    
+    assert merge_workbook_results(workbook, catalog_dir=catalog_dir) == 1
+    assert "skipped UI-DASH-001: Status 'Passed' is not one of" in capsys.readouterr().out
+    assert catalog_case(catalog_dir, "UI-DASH-001")["Status"] != "Passed"
+    assert catalog_case(catalog_dir, "UI-DASH-002")["Status"] == "Fail"
+    assert validate_catalog(catalog_dir) == []
+
+def test_unknown_outcomes_count_as_skipped():
+    assert summarize_runs([("chromium", "interrupted", 0)]) == (None, PLAYWRIGHT_NOTE + "interrupted on chromium")
+    assert summarize_runs([("chromium", "interrupted", 0), ("firefox", "unexpected", 1)])[0] == "Fail"
+    assert summarize_runs([("chromium", "interrupted", 0), ("firefox", "expected", 0)])[0] == "Pass"
+
+def test_results_are_applied_as_cases_are_iterated(catalog_dir, tmp_path):
+    report = str(tmp_path / "results.json")
+    write_report(report, "UI-DASH-002", "unexpected")
+    read = []
+    
+    def cases():
+        for test_case in iter_test_cases(catalog_dir=catalog_dir):
+            read.append(test_case["Test Case ID"])
+            yield test_case
+    applied = ingest_playwright_results(cases(), report)
+    assert read == []
+    assert [next(applied)["Status"] for _ in range(2)][1] == "Fail"
+    assert read == ["UI-DASH-001", "UI-DASH-002"]
+
+def read_json_value(reader):
+    """Rebuild the value at the reader's position through items()/elements()"""
+    char = reader.peek()
+    if char == "{":
+        return {key: read_json_value(reader) for key in reader.items()}
+    if char == "[":
+        return [read_json_value(reader) for _ in reader.elements()]
+    return reader.value()
+
+def test_json_reader_matches_json_load_at_any_chunk_size(tmp_path):
+    report = {
+        "config": {"workers": 4, "timeout": 30000.5, "grep": "/[{}]/", "retries": -1, "ratio": 1.5e-3},
+        "suites": [{
+            "title": "dashboard.spec.ts",
+            "specs": [{"title": "UI-DASH-001 ヘッダー \"title\"", "tags": ["@UI-DASH-001"], "ok": True,
+                       "tests": [{"projectName": "chromium", "status": "flaky", "results": [{}, {"retry": 1}]}]}],
+            "suites": [{"title": "empty", "specs": [], "suites": [], "extra": None}]
+        }],
+        "errors": [], "stats": {"expected": 12345678901234567890}
+    }
+    path = tmp_path / "report.json"
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    with open(path, encoding="utf-8") as f:
+        expected = json.load(f)
+    for chunk_size in (1, 2, 7, 1 << 20):
+        with open(path, encoding="utf-8") as f:
+            assert read_json_value(_JsonReader(f, chunk_size)) == expected
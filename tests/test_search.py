@@ -0,0 +1,36 @@
+import pytest
+
+from testcases.catalog import iter_test_cases
+from testcases.search import SEARCH_FIELDS, SearchIndex
+
+@pytest.fixture
+def index(catalog_dir, tmp_path):
+    with SearchIndex(str(tmp_path / "index.sqlite3")) as index:
+        index.update(catalog_dir)
+        yield index
+
+def containing(catalog_dir, *terms):
+    """Return the IDs of the test cases with every term in one of the SEARCH_FIELDS"""
+    return {
+        case["Test Case ID"] for case in iter_test_cases(catalog_dir=catalog_dir)
+        if all(any(term in case.get(field, "").casefold() for field in SEARCH_FIELDS) for term in terms)
+    }
+
+def test_terms_match_substrings_of_any_field(index, catalog_dir):
+    matches = index.search("ＯＲＤＥＲ bulk")
+    assert {case_id for _, case_id, _, _ in matches} == containing(catalog_dir, "order", "bulk") != set()
+    matches = index.search("ダッシュ")
+    assert {case_id for _, case_id, _, _ in matches} == containing(catalog_dir, "ダッシュ") != set()
+    assert index.search("no such text") == []
+
+def test_one_character_query_is_ranked_by_occurrences(index, catalog_dir):
+    matches = index.search("x", limit=200)
+    assert {case_id for _, case_id, _, _ in matches} == containing(catalog_dir, "x")
+    scores = [score for score, _, _, _ in matches]
+    assert scores == sorted(scores) and scores[0] < scores[-1] < 0
+
+def test_update_reindexes_only_edited_cases(index, catalog_dir, edit_catalog_line):
+    edit_catalog_line("dashboard.jsonl", 3, lambda record: record.update(Notes="zebra crossing"))
+    assert index.update(catalog_dir) == (1, 0)
+    assert [case_id for _, case_id, _, _ in index.search("zebra")] == ["UI-DASH-003"]
+    assert index.update(catalog_dir) == (0, 0)
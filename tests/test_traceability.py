@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from testcases import traceability
+from testcases.traceability import Traceability, scan_spec_file, scan_spec_tree
+
+SPEC = """\
+import { test } from '@playwright/test';
+
+// test('commented out', () => {});
+test.describe('Dashboard', { tag: '@smoke' }, () => {
+  test('UI-DASH-001 header title', async ({ page }) => {
+    await page.fill('#q', "{ not a scope }");
+  });
+  test.skip('Metric Values Display', async () => {});
+  test.describe.serial('nested', () => {
+    test('tagged', { tag: ['@UI-DASH-002', '@slow'] }, async () => {});
+  });
+});
+test('Header Title Display', { tag: '@UI-NONE-999' }, async () => {});
+test('orphan', async () => {});
+"""
+
+@pytest.fixture
+def spec_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(traceability, "CACHE_DIR", str(tmp_path / "cache"))
+    root = tmp_path / "tests"
+    (root / "dashboard").mkdir(parents=True)
+    (root / "dashboard" / "dashboard.spec.ts").write_text(SPEC, encoding="utf-8")
+    return root
+
+def test_scan_finds_tests_with_their_describes_tags_and_lines(spec_dir):
+    tests = scan_spec_file(str(spec_dir / "dashboard" / "dashboard.spec.ts"))
+    assert [(test["titles"], test["tags"], test["line"], test["skipped"]) for test in tests] == [
+        (["Dashboard", "UI-DASH-001 header title"], ["@smoke"], 5, False),
+        (["Dashboard", "Metric Values Display"], ["@smoke"], 8, True),
+        (["Dashboard", "nested", "tagged"], ["@smoke", "@UI-DASH-002", "@slow"], 10, False),
+        (["Header Title Display"], ["@UI-NONE-999"], 13, False),
+        (["orphan"], [], 14, False),
+    ]
+
+def test_tests_link_by_catalog_id_then_by_title(spec_dir):
+    trace = Traceability(scan_spec_tree(str(spec_dir)))
+    cases = [
+        {"Test Case ID": "UI-DASH-001", "Module": "Dashboard", "Test Case Name": "Header Title Display"},
+        {"Test Case ID": "UI-DASH-002", "Module": "Dashboard", "Test Case Name": "Unprocessed Orders"},
+        {"Test Case ID": "UI-DASH-003", "Module": "Dashboard", "Test Case Name": "Metric Values Display"},
+        {"Test Case ID": "UI-DASH-004", "Module": "Dashboard", "Test Case Name": "Header Title Display"},
+    ]
+    assert list(trace.collect(iter(cases))) == cases
+    titles = {case_id: [test["titles"][-1] for _, test in trace.links(case_id)] for case_id in trace.cases}
+    # UI-NONE-999 is not in the catalog, so that test links by its title
+    assert titles == {
+        "UI-DASH-001": ["UI-DASH-001 header title"],
+        "UI-DASH-002": ["tagged"],
+        "UI-DASH-003": ["Metric Values Display"],
+        "UI-DASH-004": ["Header Title Display"],
+    }
+    # a skipped test is linked but does not automate its case
+    assert trace.coverage() == {"Dashboard": (4, 3)}
+    assert [test["titles"] for _, test in trace.unlinked_tests()] == [["orphan"]]
+
+def test_tree_scan_is_cached_until_a_spec_changes(spec_dir, monkeypatch):
+    first = scan_spec_tree(str(spec_dir))
+    scanned = []
+    monkeypatch.setattr(traceability, "scan_spec_file", lambda path: scanned.append(path) or [])
+    assert scan_spec_tree(str(spec_dir)) == first
+    assert scanned == []
+    
+    spec = spec_dir / "dashboard" / "dashboard.spec.ts"
+    spec.write_text(SPEC + "test('another', () => {});\n", encoding="utf-8")
+    os.utime(spec, ns=(spec.stat().st_atime_ns, spec.stat().st_mtime_ns + 1))
+    assert scan_spec_tree(str(spec_dir)) == {"dashboard/dashboard.spec.ts": []}
+    assert scanned == [str(spec)]